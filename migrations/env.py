@@ -5,7 +5,7 @@ from logging.config import fileConfig
 from pathlib import Path
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -70,7 +70,26 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+# Session settings for index builds: parallel workers and a larger sort budget
+# apply to every CREATE INDEX, including CONCURRENTLY builds run in
+# autocommit blocks, since they are set at session (not transaction) level.
+MAINTENANCE_SETTINGS = {
+    "max_parallel_maintenance_workers": os.getenv(
+        "CO_MIGRATION_PARALLEL_WORKERS", "4"
+    ),
+    "maintenance_work_mem": os.getenv("CO_MIGRATION_MAINTENANCE_WORK_MEM", "1GB"),
+}
+
+
 def do_run_migrations(connection: Connection) -> None:
+    if connection.dialect.name == "postgresql":
+        for name, value in MAINTENANCE_SETTINGS.items():
+            connection.execute(
+                text("SELECT set_config(:name, :value, false)"),
+                {"name": name, "value": value},
+            )
+        connection.commit()
+
     context.configure(connection=connection, target_metadata=target_metadata)
 
     with context.begin_transaction():
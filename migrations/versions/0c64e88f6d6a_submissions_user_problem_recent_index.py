@@ -0,0 +1,59 @@
+"""submissions_user_problem_recent_index
+
+Revision ID: 0c64e88f6d6a
+Revises: d86cce16ee25
+Create Date: 2025-08-22 16:05:37.284190
+
+Replace ``idx_submissions_user_problem (user_id, problem_id)`` with a covering
+index on ``(user_id, problem_id, created_at DESC) INCLUDE (status)``. The
+"latest attempt for this user and problem" lookup in the personalization
+service becomes a single index-only probe instead of a heap fetch plus sort.
+
+Built ``CONCURRENTLY`` so ``submissions`` stays writable during the build.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0c64e88f6d6a"
+down_revision = "d86cce16ee25"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap the user/problem index for the covering recent-attempt index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_submissions_user_problem_recent",
+            "submissions",
+            ["user_id", "problem_id", sa.text("created_at DESC")],
+            postgresql_include=["status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_submissions_user_problem",
+            table_name="submissions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the plain user/problem index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_submissions_user_problem",
+            "submissions",
+            ["user_id", "problem_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_submissions_user_problem_recent",
+            table_name="submissions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
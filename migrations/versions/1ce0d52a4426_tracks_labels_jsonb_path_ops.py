@@ -0,0 +1,55 @@
+"""tracks_labels_jsonb_path_ops
+
+Revision ID: 1ce0d52a4426
+Revises: 1e2fbf87c0b9
+Create Date: 2025-08-20 10:12:31.418207
+
+Rebuild ``idx_tracks_labels`` with the ``jsonb_path_ops`` operator class. The
+label filter in ``TrackService.list_tracks`` is a containment query
+(``labels @> '["company:meta"]'``), which is the only operator family
+``jsonb_path_ops`` supports; in exchange the index is a fraction of the size of
+the default ``jsonb_ops`` index and more selective. Queries using ``?``,
+``?|`` or ``->`` against ``labels`` will not use this index.
+
+The replacement is built ``CONCURRENTLY`` under a temporary name and swapped in,
+so ``tracks`` stays writable and never goes without a labels index.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1ce0d52a4426"
+down_revision = "1e2fbf87c0b9"
+branch_labels = None
+depends_on = None
+
+
+def _rebuild_labels_index(**index_kwargs) -> None:
+    """Build the new labels index concurrently, then swap it for the old one."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_tracks_labels_new",
+            "tracks",
+            ["labels"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **index_kwargs,
+        )
+        op.drop_index(
+            "idx_tracks_labels",
+            table_name="tracks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("ALTER INDEX idx_tracks_labels_new RENAME TO idx_tracks_labels")
+
+
+def upgrade() -> None:
+    """Recreate the tracks labels index with jsonb_path_ops."""
+    _rebuild_labels_index(postgresql_ops={"labels": "jsonb_path_ops"})
+
+
+def downgrade() -> None:
+    """Restore the default jsonb_ops GIN index."""
+    _rebuild_labels_index()
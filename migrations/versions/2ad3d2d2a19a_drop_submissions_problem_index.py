@@ -0,0 +1,43 @@
+"""drop_submissions_problem_index
+
+Revision ID: 2ad3d2d2a19a
+Revises: 0c64e88f6d6a
+Create Date: 2025-08-23 10:27:14.935802
+
+Drop ``idx_submissions_problem``. Every submission lookup by problem also
+filters on ``user_id`` and is served by ``idx_submissions_user_problem_recent``;
+nothing queries ``problem_id`` across all users, so the single-column index
+only costs write amplification and WAL on every insert. Check
+``pg_stat_user_indexes.idx_scan`` is ~0 before applying in production.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2ad3d2d2a19a"
+down_revision = "0c64e88f6d6a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop the redundant problem_id index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_submissions_problem",
+            table_name="submissions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Recreate the problem_id index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_submissions_problem",
+            "submissions",
+            ["problem_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
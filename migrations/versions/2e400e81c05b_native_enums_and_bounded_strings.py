@@ -0,0 +1,111 @@
+"""native_enums_and_bounded_strings
+
+Revision ID: 2e400e81c05b
+Revises: 9626a627810a
+Create Date: 2025-08-27 14:05:52.118394
+
+Replace the ``subject``, ``sessions.mode`` and ``submissions.status`` varchar
+columns with native enum types (``subject``, ``session_mode``,
+``submission_status``). An enum value is stored in 4 bytes, shrinking
+``idx_sessions_user_subject`` and the ``status`` payload of
+``idx_submissions_user_problem_recent``. The ``IN (...)`` check constraints
+they replace are dropped as redundant.
+
+Identifier columns get explicit widths matching ``study_tasks.problem_id``
+(``varchar(100)``) and ``task_evaluations.language`` (``varchar(50)``); the
+upgrade fails if existing data is longer.
+
+Enum conversions rewrite ``tracks``, ``sessions`` and ``submissions`` (and
+rebuild their indexes on those columns) under an ACCESS EXCLUSIVE lock;
+schedule accordingly.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "2e400e81c05b"
+down_revision = "9626a627810a"
+branch_labels = None
+depends_on = None
+
+ENUM_TYPES = {
+    "subject": ("coding", "math", "systems"),
+    "session_mode": ("practice", "mock", "track"),
+    "submission_status": ("passed", "failed", "timeout", "error"),
+}
+
+# (table, column, enum type, replaced check constraint)
+ENUM_COLUMNS = (
+    ("tracks", "subject", "subject", "check_subject"),
+    ("sessions", "subject", "subject", "check_session_subject"),
+    ("sessions", "mode", "session_mode", "check_mode"),
+    ("submissions", "subject", "subject", "check_submission_subject"),
+    ("submissions", "status", "submission_status", "check_status"),
+)
+
+# (table, column, width, nullable)
+BOUNDED_COLUMNS = (
+    ("tracks", "slug", 100, False),
+    ("sessions", "problem_id", 100, True),
+    ("submissions", "problem_id", 100, False),
+    ("submissions", "language", 50, True),
+    ("review_queue", "problem_id", 100, False),
+    ("review_queue", "reason", 50, False),
+)
+
+
+def upgrade() -> None:
+    """Convert closed value sets to enums and bound identifier widths."""
+    bind = op.get_bind()
+    for name, values in ENUM_TYPES.items():
+        postgresql.ENUM(*values, name=name).create(bind, checkfirst=True)
+
+    for table, column, enum_name, constraint in ENUM_COLUMNS:
+        op.drop_constraint(constraint, table, type_="check")
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.ENUM(name=enum_name, create_type=False),
+            existing_type=sa.String(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::{enum_name}",
+        )
+
+    for table, column, width, nullable in BOUNDED_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(width),
+            existing_type=sa.String(),
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    """Restore unbounded varchar columns and the check constraints."""
+    for table, column, width, nullable in BOUNDED_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(),
+            existing_type=sa.String(width),
+            existing_nullable=nullable,
+        )
+
+    for table, column, enum_name, constraint in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(),
+            existing_type=postgresql.ENUM(name=enum_name, create_type=False),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        values = ", ".join(f"'{value}'" for value in ENUM_TYPES[enum_name])
+        op.create_check_constraint(constraint, table, f"{column} IN ({values})")
+
+    bind = op.get_bind()
+    for name in ENUM_TYPES:
+        postgresql.ENUM(name=name).drop(bind, checkfirst=True)
@@ -0,0 +1,61 @@
+"""submissions_session_payload_index
+
+Revision ID: 39693b8ddf04
+Revises: 2e400e81c05b
+Create Date: 2025-08-28 10:17:43.652081
+
+Replace ``idx_submissions_session (session_id)`` with
+``idx_submissions_session_payload (session_id, payload_sha256)``. Its leading
+column still serves every per-session lookup, and ``submit_attempt`` uses the
+full key to find an identical earlier attempt in the same session and replay
+its stored result instead of re-running the evaluator.
+
+The index is deliberately not unique: existing rows already contain repeated
+payloads, and a replay is a lookup rather than a constraint.
+
+Built ``CONCURRENTLY`` so ``submissions`` stays writable during the build.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "39693b8ddf04"
+down_revision = "2e400e81c05b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap the session index for the session/payload index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_submissions_session_payload",
+            "submissions",
+            ["session_id", "payload_sha256"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_submissions_session",
+            table_name="submissions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the plain session index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_submissions_session",
+            "submissions",
+            ["session_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_submissions_session_payload",
+            table_name="submissions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,50 @@
+"""study_tasks_jsonb_gin_indexes
+
+Revision ID: 3d7db1df56c5
+Revises: 1ce0d52a4426
+Create Date: 2025-08-20 11:02:47.903114
+
+Add ``jsonb_path_ops`` GIN indexes on ``study_tasks.topic_tags`` and
+``study_tasks.metadata``. Both only accelerate containment, so tag filters must
+be written as ``topic_tags @> '["dp"]'`` (``StudyTask.topic_tags.contains``)
+rather than ``topic_tags ? 'dp'`` to use the index.
+
+Indexes are built ``CONCURRENTLY`` outside the migration transaction so
+``study_tasks`` keeps accepting writes during the build; ``IF NOT EXISTS`` makes
+a retry after a failed build safe (drop any ``INVALID`` leftover first).
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3d7db1df56c5"
+down_revision = "1ce0d52a4426"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create GIN indexes on the study task JSONB columns."""
+    with op.get_context().autocommit_block():
+        for column in ("topic_tags", "metadata"):
+            op.create_index(
+                f"idx_study_tasks_{column}",
+                "study_tasks",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the study task JSONB GIN indexes."""
+    with op.get_context().autocommit_block():
+        for column in ("metadata", "topic_tags"):
+            op.drop_index(
+                f"idx_study_tasks_{column}",
+                table_name="study_tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
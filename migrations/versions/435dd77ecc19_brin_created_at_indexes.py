@@ -0,0 +1,70 @@
+"""brin_created_at_indexes
+
+Revision ID: 435dd77ecc19
+Revises: 2ad3d2d2a19a
+Create Date: 2025-08-23 15:42:09.318457
+
+Index the append-only ``created_at`` columns of ``task_events``,
+``task_evaluations`` and ``submissions`` with BRIN. Rows arrive in timestamp
+order, so a block-range summary serves time-window scans at a tiny fraction of
+a BTREE's size and write cost.
+
+The task lookup indexes on the event tables shrink to ``(task_id)``: per-task
+row counts are small, so the trailing ``created_at`` key only added bloat.
+Both event tables are partitioned, where ``CONCURRENTLY`` is unsupported; the
+``submissions`` index is built concurrently.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "435dd77ecc19"
+down_revision = "2ad3d2d2a19a"
+branch_labels = None
+depends_on = None
+
+EVENT_TABLES = {
+    "task_events": ("idx_task_events_task", "brin_task_events_created"),
+    "task_evaluations": ("idx_task_eval_task", "brin_task_evaluations_created"),
+}
+
+
+def upgrade() -> None:
+    """Create BRIN created_at indexes and narrow the task lookup indexes."""
+    for table, (task_index, brin_index) in EVENT_TABLES.items():
+        op.drop_index(task_index, table_name=table)
+        op.create_index(task_index, table, ["task_id"])
+        op.create_index(
+            brin_index,
+            table,
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "brin_submissions_created",
+            "submissions",
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the BRIN indexes and restore the (task_id, created_at) indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "brin_submissions_created",
+            table_name="submissions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    for table, (task_index, brin_index) in EVENT_TABLES.items():
+        op.drop_index(brin_index, table_name=table)
+        op.drop_index(task_index, table_name=table)
+        op.create_index(task_index, table, ["task_id", "created_at"])
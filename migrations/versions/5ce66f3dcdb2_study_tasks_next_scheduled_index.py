@@ -0,0 +1,46 @@
+"""study_tasks_next_scheduled_index
+
+Revision ID: 5ce66f3dcdb2
+Revises: 162d8480bd8d
+Create Date: 2025-08-26 15:21:08.640193
+
+Add ``idx_study_tasks_next_scheduled (path_id, scheduled_at) WHERE status =
+'scheduled'`` for ``StudyTaskService.get_next_task``. The query picks the
+earliest scheduled task across a user's paths; with the status filter in the
+index predicate each path contributes its first index entry and no heap rows
+for completed or skipped tasks are visited. Only scheduled tasks are indexed,
+so it stays a small fraction of ``idx_study_tasks_path_schedule``.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5ce66f3dcdb2"
+down_revision = "162d8480bd8d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the partial index for the next scheduled task."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_study_tasks_next_scheduled",
+            "study_tasks",
+            ["path_id", "scheduled_at"],
+            postgresql_where=sa.text("status = 'scheduled'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the partial next-scheduled-task index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_study_tasks_next_scheduled",
+            table_name="study_tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
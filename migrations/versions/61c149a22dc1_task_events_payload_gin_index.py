@@ -0,0 +1,38 @@
+"""task_events_payload_gin_index
+
+Revision ID: 61c149a22dc1
+Revises: 98486cb8b8e3
+Create Date: 2025-08-25 11:34:58.172640
+
+Index ``task_events.payload`` with a ``jsonb_path_ops`` GIN index so event
+analytics can filter on any payload key, e.g. ``payload @>
+'{"hint_level": 2}'`` (``TaskEvent.payload.contains({...})``). Filters must be
+written as containment; ``payload->>'key' = 'v'`` does not use this index.
+
+``task_events`` is partitioned, so the index is built in the migration
+transaction (``CONCURRENTLY`` is unsupported there).
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "61c149a22dc1"
+down_revision = "98486cb8b8e3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the payload GIN index."""
+    op.create_index(
+        "idx_task_events_payload",
+        "task_events",
+        ["payload"],
+        postgresql_using="gin",
+        postgresql_ops={"payload": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop the payload GIN index."""
+    op.drop_index("idx_task_events_payload", table_name="task_events")
@@ -0,0 +1,46 @@
+"""submissions_payload_sha256_bytea
+
+Revision ID: 9626a627810a
+Revises: 5ce66f3dcdb2
+Create Date: 2025-08-27 09:48:13.275940
+
+Store ``submissions.payload_sha256`` as the raw 32-byte digest (``bytea``)
+instead of a 64-character hex ``varchar``. Existing values are converted in
+place with ``decode(..., 'hex')``. The type change rewrites ``submissions``
+under an ACCESS EXCLUSIVE lock; schedule accordingly.
+
+No index is added: nothing looks submissions up by payload hash yet.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9626a627810a"
+down_revision = "5ce66f3dcdb2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert hex digests to raw bytes."""
+    op.alter_column(
+        "submissions",
+        "payload_sha256",
+        type_=sa.LargeBinary(length=32),
+        existing_type=sa.String(),
+        existing_nullable=True,
+        postgresql_using="decode(payload_sha256, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    """Convert raw digests back to hex strings."""
+    op.alter_column(
+        "submissions",
+        "payload_sha256",
+        type_=sa.String(),
+        existing_type=sa.LargeBinary(length=32),
+        existing_nullable=True,
+        postgresql_using="encode(payload_sha256, 'hex')",
+    )
@@ -0,0 +1,59 @@
+"""review_queue_due_user_index
+
+Revision ID: 98486cb8b8e3
+Revises: cedf4ca11550
+Create Date: 2025-08-24 13:16:40.552981
+
+Replace ``idx_review_due (next_due_at)`` with ``idx_review_due_user (user_id,
+next_due_at)``. Every due-review query filters on one user and orders by
+``next_due_at``, so the composite answers it with a single range scan instead
+of walking every user's due rows.
+
+A partial ``WHERE next_due_at <= now() + interval '7 days'`` index is not
+possible: index predicates must be immutable and ``now()`` is not. There is no
+cross-user sweeper query, so no global ``next_due_at`` index is kept.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "98486cb8b8e3"
+down_revision = "cedf4ca11550"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap the global due index for the per-user one."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_review_due_user",
+            "review_queue",
+            ["user_id", "next_due_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_review_due",
+            table_name="review_queue",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the global due index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_review_due",
+            "review_queue",
+            ["next_due_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_review_due_user",
+            table_name="review_queue",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,42 @@
+"""drop_sessions_user_index
+
+Revision ID: cedf4ca11550
+Revises: 435dd77ecc19
+Create Date: 2025-08-24 09:51:26.047713
+
+Drop ``idx_sessions_user``. Its ``(user_id)`` key is a prefix of
+``idx_sessions_user_subject (user_id, subject)``, which serves the same
+equality lookups, so the single-column index only adds a BTREE update per
+write. Check ``pg_stat_user_indexes.idx_scan`` before applying in production.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "cedf4ca11550"
+down_revision = "435dd77ecc19"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop the redundant user_id index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_sessions_user",
+            table_name="sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Recreate the user_id index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_sessions_user",
+            "sessions",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,162 @@
+"""partition_task_event_tables
+
+Revision ID: d86cce16ee25
+Revises: 3d7db1df56c5
+Create Date: 2025-08-21 09:40:05.227361
+
+Convert ``task_events`` and ``task_evaluations`` into tables RANGE-partitioned
+by month on ``created_at``. Both are append-only logs that grow without bound;
+monthly partitions let date-window queries prune and make retention a
+``DROP TABLE <partition>`` instead of ``DELETE`` + vacuum.
+
+``study_tasks`` itself stays a plain table: it is the target of foreign keys
+from both tables above, and a partitioned table's unique keys must include the
+partition key.
+
+Partitions are created by ``create_monthly_partition(parent, month)``; run
+``scripts/create_partitions.py`` daily to keep future months provisioned. Rows
+falling outside any monthly partition land in ``<table>_default``.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d86cce16ee25"
+down_revision = "3d7db1df56c5"
+branch_labels = None
+depends_on = None
+
+PARTITIONED_TABLES = ("task_events", "task_evaluations")
+
+CREATE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_monthly_partition(parent regclass, month date)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    start_at date := date_trunc('month', month)::date;
+    end_at date := (date_trunc('month', month) + interval '1 month')::date;
+    partition_name text := format(
+        '%s_y%sm%s', parent, to_char(start_at, 'YYYY'), to_char(start_at, 'MM')
+    );
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        parent,
+        start_at::timestamp AT TIME ZONE 'UTC',
+        end_at::timestamp AT TIME ZONE 'UTC'
+    );
+END;
+$$
+"""
+
+TABLE_DDL = {
+    "task_events": """
+        CREATE TABLE task_events (
+            id uuid NOT NULL,
+            task_id uuid NOT NULL
+                REFERENCES study_tasks (id) ON DELETE CASCADE,
+            event_type task_event_type NOT NULL,
+            payload jsonb NOT NULL DEFAULT '{}'::jsonb,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """,
+    "task_evaluations": """
+        CREATE TABLE task_evaluations (
+            id uuid NOT NULL,
+            task_id uuid NOT NULL
+                REFERENCES study_tasks (id) ON DELETE CASCADE,
+            submission_id uuid REFERENCES submissions (id),
+            language varchar(50),
+            code text,
+            test_cases_passed integer NOT NULL DEFAULT 0,
+            test_cases_total integer NOT NULL DEFAULT 0,
+            runtime_ms integer,
+            memory_mb integer,
+            error_message text,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            metadata jsonb NOT NULL DEFAULT '{}'::jsonb,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """,
+}
+
+INDEXES = {
+    "task_events": ("idx_task_events_task", "task_id, created_at"),
+    "task_evaluations": ("idx_task_eval_task", "task_id, created_at"),
+}
+
+
+def _create_partitions_for(table: str, source: str) -> None:
+    """Create monthly partitions covering ``source`` rows plus three months."""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc(
+                        'month',
+                        COALESCE((SELECT min(created_at) FROM {source}), now())
+                    ),
+                    date_trunc('month', now()) + interval '3 months',
+                    interval '1 month'
+                )::date
+            LOOP
+                PERFORM create_monthly_partition('{table}', month);
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+
+def upgrade() -> None:
+    """Swap the event tables for partitioned copies and move existing rows."""
+    op.execute(CREATE_PARTITION_FUNCTION)
+
+    for table in PARTITIONED_TABLES:
+        index_name, index_columns = INDEXES[table]
+        legacy = f"{table}_legacy"
+
+        op.execute(f"DROP INDEX {index_name}")
+        op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        op.execute(
+            f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey"
+        )
+
+        op.execute(TABLE_DDL[table])
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        _create_partitions_for(table, legacy)
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+        op.execute(f"DROP TABLE {legacy}")
+        op.execute(f"CREATE INDEX {index_name} ON {table} ({index_columns})")
+
+
+def downgrade() -> None:
+    """Collapse the partitioned tables back into plain tables."""
+    for table in PARTITIONED_TABLES:
+        index_name, index_columns = INDEXES[table]
+        partitioned = f"{table}_partitioned"
+
+        op.execute(f"DROP INDEX {index_name}")
+        op.execute(f"ALTER TABLE {table} RENAME TO {partitioned}")
+        op.execute(
+            f"ALTER TABLE {partitioned} "
+            f"RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey"
+        )
+        op.execute(
+            TABLE_DDL[table]
+            .replace("PRIMARY KEY (id, created_at)", "PRIMARY KEY (id)")
+            .replace("PARTITION BY RANGE (created_at)", "")
+        )
+        op.execute(f"INSERT INTO {table} SELECT * FROM {partitioned}")
+        op.execute(f"DROP TABLE {partitioned} CASCADE")
+        op.execute(f"CREATE INDEX {index_name} ON {table} ({index_columns})")
+
+    op.execute("DROP FUNCTION IF EXISTS create_monthly_partition(regclass, date)")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Provision upcoming monthly partitions for the partitioned event tables.
+
+Run daily (e.g. from cron) so that future months always have a partition
+before rows arrive; anything outside a monthly partition falls into the
+table's DEFAULT partition.
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from co.db import base
+
+PARTITIONED_TABLES = ("task_events", "task_evaluations")
+MONTHS_AHEAD = 3
+
+CREATE_PARTITIONS_SQL = text(
+    """
+    SELECT create_monthly_partition(CAST(:table AS regclass), month::date)
+    FROM generate_series(
+        date_trunc('month', now()),
+        date_trunc('month', now()) + make_interval(months => :months_ahead),
+        interval '1 month'
+    ) AS month
+    """
+)
+
+
+async def create_partitions(months_ahead: int = MONTHS_AHEAD) -> None:
+    """Create partitions for the current month and ``months_ahead`` after it."""
+    if base.engine is None:
+        await base.init_db()
+
+    assert base.engine is not None
+    async with base.engine.begin() as conn:
+        for table in PARTITIONED_TABLES:
+            await conn.execute(
+                CREATE_PARTITIONS_SQL,
+                {"table": table, "months_ahead": months_ahead},
+            )
+            print(f"✅ {table}: partitions provisioned {months_ahead} months ahead")
+
+
+def main() -> None:
+    """Main entry point for partition maintenance."""
+    asyncio.run(create_partitions())
+
+
+if __name__ == "__main__":
+    main()
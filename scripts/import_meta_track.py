@@ -1,18 +1,68 @@
+import argparse
 import asyncio
-import json
+import os
+import sys
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, List
-from sqlalchemy import select
+from typing import Dict, List, Optional, Tuple
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from co.clients.problem_bank import ProblemBankClient
 from co.db import base
 from co.db.models import Track
+from co.services.tracks import cache_bust_tracks
 
 TRACK_SLUG = "coding-interview-meta"
 PROBLEM_BANK_PATH = Path(__file__).parent.parent.parent / "scimigo-problem-bank"
+TRACK_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "scimigo-co"
+)
+TRACK_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Rows per multi-VALUES INSERT statement sent to asyncpg
+IMPORT_BATCH_SIZE = 1000
 
 
-def validate_module_coverage(track_data: Dict, problem_bank_path: Path) -> Dict[str, Dict]:
+def load_cached_track(slug: str) -> Optional[Dict]:
+    """Return the cached Problem Bank payload for ``slug`` if still fresh."""
+    cache_file = TRACK_CACHE_DIR / f"track-{slug}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime > TRACK_CACHE_TTL_SECONDS:
+            return None
+        return orjson.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_track(slug: str, track_data: Dict) -> None:
+    """Atomically write the Problem Bank payload for ``slug`` to the cache."""
+    TRACK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=TRACK_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(track_data))
+        os.replace(tmp_path, TRACK_CACHE_DIR / f"track-{slug}.json")
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _count_yaml_files(module_dir: str) -> int:
+    """Count ``*.yml`` entries in ``module_dir`` using a single scandir pass."""
+    with os.scandir(module_dir) as entries:
+        return sum(1 for entry in entries if entry.name.endswith(".yml"))
+
+
+async def count_module_problems(module_dir: str) -> int:
+    """Count a module's problem files in a worker thread (blocking directory walk)."""
+    return await asyncio.to_thread(_count_yaml_files, module_dir)
+
+
+async def validate_module_coverage(track_data: Dict, problem_bank_path: Path) -> Dict[str, Dict]:
     """Validate that each module has sufficient problems across difficulty levels.
     
     Returns:
@@ -33,12 +83,21 @@ def validate_module_coverage(track_data: Dict, problem_bank_path: Path) -> Dict[
     # Count Meta-specific problems
     meta_problems_dir = problem_bank_path / "meta-problems" / "seed" / "problems" / "meta"
     if meta_problems_dir.exists():
-        for module_dir in meta_problems_dir.iterdir():
-            if module_dir.is_dir() and module_dir.name in module_stats:
-                for problem_file in module_dir.glob("*.yml"):
-                    module_stats[module_dir.name]["total"] += 1
-                    # Would need to parse YAML to get difficulty, simplified for now
-                    module_stats[module_dir.name]["by_difficulty"][2] += 1
+        # DirEntry.is_dir() comes from the directory listing, no extra stat()
+        with os.scandir(meta_problems_dir) as entries:
+            module_dirs = [
+                entry
+                for entry in entries
+                if entry.name in module_stats and entry.is_dir()
+            ]
+        # Walk module directories concurrently instead of one after another
+        counts = await asyncio.gather(
+            *(count_module_problems(entry.path) for entry in module_dirs)
+        )
+        for module_dir, count in zip(module_dirs, counts):
+            module_stats[module_dir.name]["total"] += count
+            # Would need to parse YAML to get difficulty, simplified for now
+            module_stats[module_dir.name]["by_difficulty"][2] += count
     
     # Count public dataset problems (already classified by module)
     public_problems_dir = problem_bank_path / "public-datasets" / "processed" / "apps"
@@ -56,76 +115,139 @@ def validate_module_coverage(track_data: Dict, problem_bank_path: Path) -> Dict[
     return module_stats
 
 
-async def import_meta_track() -> Track:
-    """Import Meta coding interview track from Problem Bank into local DB."""
+def format_coverage_report(track_data: Dict, module_stats: Dict[str, Dict]) -> Tuple[str, bool]:
+    """Render the module coverage report.
+    
+    Returns:
+        The report text and whether every module covers its difficulty range
+    """
+    parts = ["\n", "=" * 60, "\nModule Coverage Report:\n", "=" * 60, "\n"]
+    all_valid = True
+    for module in track_data["modules"]:
+        module_id = module["id"]
+        stats = module_stats[module_id]
+        min_difficulty, max_difficulty = stats["min_difficulty"], stats["max_difficulty"]
+        parts.append(f"\n📚 {module['title']} ({module_id})\n")
+        parts.append(f"   Total problems: {stats['total']}\n")
+        parts.append(f"   Difficulty range: {min_difficulty}-{max_difficulty}\n")
+        parts.append("   Distribution: ")
+        for diff in range(1, 6):
+            count = stats["by_difficulty"][diff]
+            if not min_difficulty <= diff <= max_difficulty:
+                parts.append(f"D{diff}:- ")
+            elif count == 0:
+                parts.append(f"D{diff}:❌ ")
+                all_valid = False
+            else:
+                parts.append(f"D{diff}:{count}✅ ")
+        parts.append("\n")
+    return "".join(parts), all_valid
+
+
+def build_track_row(track_data: Dict) -> Dict:
+    """Map a Problem Bank track payload onto ``tracks`` column values."""
+    return {
+        "slug": track_data["slug"],
+        "subject": track_data["subject"],
+        "title": track_data["title"],
+        "labels": track_data.get("labels", []),
+        "modules": track_data.get("modules", []),
+        "version": track_data.get("version", "v1"),
+    }
+
+
+# Columns refreshed from the Problem Bank payload when the slug already exists
+UPSERT_COLUMNS = ("title", "labels", "modules", "version")
+
+
+async def upsert_tracks(session: AsyncSession, rows: List[Dict]) -> List[Track]:
+    """Upsert track rows with a single executemany instead of per-row add/flush.
+
+    SQLAlchemy's "insertmanyvalues" mode folds up to ``IMPORT_BATCH_SIZE`` rows
+    into one prepared multi-row INSERT, so a batch costs one asyncpg round-trip
+    per page rather than one per row.
+
+    ``INSERT ... ON CONFLICT (slug) DO UPDATE ... RETURNING`` refreshes tracks
+    that already exist in the same statement, so there is no racy
+    select-then-insert and every upserted track comes back without a reload.
+    The caller owns the transaction; commit once after all rows are loaded.
+    """
+    if not rows:
+        return []
+
+    stmt = pg_insert(Track)
+    stmt = (
+        stmt.on_conflict_do_update(
+            index_elements=["slug"],
+            set_={column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+        )
+        .returning(Track)
+        .execution_options(
+            insertmanyvalues_page_size=IMPORT_BATCH_SIZE, populate_existing=True
+        )
+    )
+    result = await session.scalars(stmt, rows)
+    return list(result.all())
+
+
+async def import_meta_track(disable_triggers: bool = False) -> Track:
+    """Import Meta coding interview track from Problem Bank into local DB.
+
+    Args:
+        disable_triggers: Run the load with ``session_replication_role =
+            replica`` so user triggers (and FK enforcement) are skipped for the
+            import transaction. Operator-initiated imports only; requires a
+            superuser role.
+    """
     if base.engine is None:
         await base.init_db()
     
     # Load track definition from Problem Bank
     track_file = PROBLEM_BANK_PATH / "meta-problems" / "seed" / "tracks" / "meta-coding-interview.json"
     if not track_file.exists():
-        # Fall back to fetching from API if local file doesn't exist
-        client = ProblemBankClient()
-        track_data = await client.get_track(TRACK_SLUG)
+        # Fall back to the API (via the local cache) if local file doesn't exist
+        track_data = load_cached_track(TRACK_SLUG)
+        if track_data is None:
+            client = ProblemBankClient()
+            track_data = await client.get_track(TRACK_SLUG)
+            store_cached_track(TRACK_SLUG, track_data)
     else:
-        with open(track_file, "r") as f:
-            track_data = json.load(f)
+        track_data = orjson.loads(track_file.read_bytes())
 
     # Validate module coverage
     print(f"\n📊 Validating module coverage for {track_data['title']}...")
-    module_stats = validate_module_coverage(track_data, PROBLEM_BANK_PATH)
-    
-    # Print validation results
-    print("\n" + "=" * 60)
-    print("Module Coverage Report:")
-    print("=" * 60)
+    module_stats = await validate_module_coverage(track_data, PROBLEM_BANK_PATH)
     
-    all_valid = True
-    for module in track_data["modules"]:
-        module_id = module["id"]
-        stats = module_stats[module_id]
-        print(f"\n📚 {module['title']} ({module_id})")
-        print(f"   Total problems: {stats['total']}")
-        print(f"   Difficulty range: {stats['min_difficulty']}-{stats['max_difficulty']}")
-        print(f"   Distribution: ", end="")
-        for diff in range(1, 6):
-            count = stats['by_difficulty'][diff]
-            if diff >= stats['min_difficulty'] and diff <= stats['max_difficulty']:
-                if count == 0:
-                    print(f"D{diff}:❌ ", end="")
-                    all_valid = False
-                else:
-                    print(f"D{diff}:{count}✅ ", end="")
-            else:
-                print(f"D{diff}:- ", end="")
-        print()
+    # Print validation results in one write rather than a syscall per cell
+    report, all_valid = format_coverage_report(track_data, module_stats)
+    sys.stdout.write(report)
     
     if not all_valid:
         print("\n⚠️  Warning: Some modules lack problems for required difficulty levels")
     else:
         print("\n✅ All modules have sufficient problem coverage!")
     
-    # Store track in database
+    # Store track in database: one transaction for the whole batch, with
+    # DEFERRABLE constraints checked once at COMMIT instead of per row
     async with base.AsyncSessionLocal() as session:
-        # Check if track already exists
-        existing = await session.execute(select(Track).where(Track.slug == track_data["slug"]))
-        track = existing.scalar_one_or_none()
-        if track:
-            print(f"\n✅ Track '{track_data['slug']}' already exists in database")
-            return track
-
-        track = Track(
-            slug=track_data["slug"],
-            subject=track_data["subject"],
-            title=track_data["title"],
-            labels=track_data.get("labels", []),
-            modules=track_data.get("modules", []),
-            version=track_data.get("version", "v1"),
-        )
-        session.add(track)
-        await session.commit()
-        await session.refresh(track)
-        
+        async with session.begin():
+            await session.execute(text("SET CONSTRAINTS ALL DEFERRED"))
+            if disable_triggers:
+                # LOCAL: reverts automatically when the transaction ends
+                await session.execute(
+                    text("SET LOCAL session_replication_role = replica")
+                )
+
+            # ON CONFLICT makes the import idempotent without a separate lookup
+            [track] = await upsert_tracks(session, [build_track_row(track_data)])
+
+        # Cached /v1/tracks responses would otherwise serve the old track
+        # until their TTL runs out
+        try:
+            await cache_bust_tracks()
+        except RedisError as e:
+            print(f"⚠️  Could not clear cached track responses: {e}")
+
         print(f"\n✅ Successfully imported track: {track_data['title']}")
         print(f"   - Slug: {track.slug}")
         print(f"   - Modules: {len(track.modules)}")
@@ -136,9 +258,19 @@ async def import_meta_track() -> Track:
 
 def main() -> None:
     """Main entry point for track import."""
+    parser = argparse.ArgumentParser(
+        description="Import the Meta coding interview track."
+    )
+    parser.add_argument(
+        "--disable-triggers",
+        action="store_true",
+        help="skip non-system triggers during the load (superuser only)",
+    )
+    args = parser.parse_args()
+
     print("🚀 Starting Meta Coding Interview Track import...")
     print("=" * 60)
-    track = asyncio.run(import_meta_track())
+    track = asyncio.run(import_meta_track(disable_triggers=args.disable_triggers))
     print("\n" + "=" * 60)
     print("🎯 Import complete!")
     print(f"Track accessible at: /v1/tracks/{track.slug}")
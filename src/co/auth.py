@@ -1,5 +1,10 @@
 """JWT authentication and authorization."""
 
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 import jwt
@@ -10,40 +15,86 @@ from co.config import get_settings
 
 security = HTTPBearer()
 
+# Settings are frozen; snapshot the JWT parameters read on every request
+_settings = get_settings()
+_JWT_ALGORITHMS = [_settings.jwt_algorithm]
+# Parse the PEM (or encode the HMAC secret) once; jwt.decode reuses key objects.
+# Without a configured key keep the old placeholder so startup does not fail.
+_JWT_KEY: Any = (
+    jwt.get_algorithm_by_name(_settings.jwt_algorithm).prepare_key(
+        _settings.jwt_public_key
+    )
+    if _settings.jwt_public_key
+    else "secret"
+)
+_JWT_AUDIENCE = _settings.jwt_audience
+_JWT_ISSUER = _settings.jwt_issuer
+
+# Hyphenated, plain hex, braced and urn:uuid: forms, as UUID() accepts them;
+# rejects malformed values without raising and catching a ValueError
+_UUID_RE = re.compile(
+    r"^(?:urn:uuid:)?(\{)?([0-9a-fA-F]{8})-?([0-9a-fA-F]{4})-?([0-9a-fA-F]{4})"
+    r"-?([0-9a-fA-F]{4})-?([0-9a-fA-F]{12})(?(1)\})$"
+)
+
+# Verified payloads keyed by a digest of the raw token, evicted LRU-first
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """Verify and decode a JWT, memoizing the payload until the token expires.
+
+    Clients resend the same token on every request, so caching skips the
+    signature verification on repeat hits. Tokens without ``exp`` are never
+    cached. Raises ``jwt.InvalidTokenError`` subclasses like ``jwt.decode``.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            _token_cache.move_to_end(key)
+            return payload
+        # Expired: drop it and let jwt.decode raise ExpiredSignatureError
+        del _token_cache[key]
+
+    payload = jwt.decode(
+        token,
+        _JWT_KEY,
+        algorithms=_JWT_ALGORITHMS,
+        audience=_JWT_AUDIENCE,
+        issuer=_JWT_ISSUER,
+    )
+    if "exp" in payload:
+        _token_cache[key] = payload
+        if len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+    return payload
+
+
+def parse_uuid(value: Any) -> Optional[UUID]:
+    """Return ``value`` as a UUID, or None if it is not a well-formed UUID."""
+    if isinstance(value, UUID):
+        return value
+    match = _UUID_RE.match(value) if isinstance(value, str) else None
+    if match is None:
+        return None
+    # Already validated; skip UUID(hex)'s own normalization
+    return UUID(bytes=bytes.fromhex("".join(match.groups()[1:])))
+
 
 async def get_current_user(
     request: Request,
     credentials: HTTPAuthorizationCredentials = Security(security),
 ) -> UUID:
     """Extract and validate user ID from JWT token."""
-    settings = get_settings()
-
-    # Prefer user ID from middleware if available
+    # Prefer user ID from middleware if available (already parsed to a UUID)
     user_id = getattr(request.state, "user_id", None)
-    if user_id:
-        try:
-            return UUID(str(user_id))
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid user ID format",
-            )
+    if isinstance(user_id, UUID):
+        return user_id
 
     try:
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.jwt_public_key or "secret",
-            algorithms=[settings.jwt_algorithm],
-            audience=settings.jwt_audience,
-            issuer=settings.jwt_issuer,
-        )
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: missing user ID",
-            )
-        return UUID(user_id)
+        payload = decode_token(credentials.credentials)
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -54,8 +105,17 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token: {str(e)}",
         )
-    except ValueError:
+
+    subject = payload.get("sub")
+    if not subject:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: missing user ID",
+        )
+    parsed = parse_uuid(subject)
+    if parsed is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user ID format",
         )
+    return parsed
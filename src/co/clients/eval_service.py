@@ -1,44 +1,46 @@
 """Evaluation Service API client."""
 
-from typing import Any, Dict, cast
+from typing import Any, ClassVar, Dict, cast
 
 import httpx
+import orjson
+from co.clients.http import get_http_client
 from co.config import get_settings
 
+# Settings are frozen, so the base URL is read once at import
+_BASE_URL = get_settings().eval_base
+
 
 class EvalServiceClient:
     """Client for code and math evaluation service."""
 
+    # Sent on every call; baked into the pooled client once
+    _HEADERS: ClassVar[Dict[str, str]] = {
+        "X-Service": "curriculum-orchestrator",
+        "Content-Type": "application/json",
+    }
+
     def __init__(self):
-        self.settings = get_settings()
-        self.base_url = self.settings.eval_base
+        self.base_url = _BASE_URL
         self.timeout = httpx.Timeout(60.0)  # Longer timeout for code execution
 
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Pooled client shared by every instance talking to this service."""
+        return get_http_client(self.base_url, self.timeout, self._HEADERS)
+
     async def evaluate_code(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate code submission."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/evaluate/code",
-                json=request,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return cast(Dict[str, Any], response.json())
+        response = await self._client.post(
+            "/evaluate/code", content=orjson.dumps(request)
+        )
+        response.raise_for_status()
+        return cast(Dict[str, Any], orjson.loads(response.content))
 
     async def evaluate_math(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate math submission."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/evaluate/math",
-                json=request,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return cast(Dict[str, Any], response.json())
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API calls."""
-        return {
-            "X-Service": "curriculum-orchestrator",
-            "Content-Type": "application/json",
-        }
+        response = await self._client.post(
+            "/evaluate/math", content=orjson.dumps(request)
+        )
+        response.raise_for_status()
+        return cast(Dict[str, Any], orjson.loads(response.content))
@@ -0,0 +1,42 @@
+"""Shared, pooled HTTP clients for downstream services."""
+
+from typing import Dict, Mapping
+
+import httpx
+
+# Per-service connection pool bounds
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# Retries cover failed connects only, so they are safe for non-idempotent POSTs
+HTTP_CONNECT_RETRIES = 2
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_http_client(
+    base_url: str, timeout: httpx.Timeout, headers: Mapping[str, str]
+) -> httpx.AsyncClient:
+    """Return the process-wide keep-alive client for ``base_url``.
+
+    The client is created on first use and reused by every call afterwards, so
+    requests share pooled connections instead of reconnecting each time.
+    """
+    client = _clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            headers=dict(headers),
+            transport=httpx.AsyncHTTPTransport(
+                limits=HTTP_LIMITS, retries=HTTP_CONNECT_RETRIES
+            ),
+        )
+        _clients[base_url] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all pooled clients (called on application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
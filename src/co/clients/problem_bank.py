@@ -1,39 +1,133 @@
 """Problem Bank API client."""
 
-from typing import Any, Dict, List, Optional, cast
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, cast
 from uuid import UUID
 
 import httpx
+import orjson
+from co.clients.http import get_http_client
+from co.clients.redis import get_redis
 from co.config import get_settings
+from redis.exceptions import RedisError
+
+# Settings are frozen, so the base URL is read once at import
+_BASE_URL = get_settings().problem_bank_base
+
+# Problem content is immutable per version; hidden bundles change even less
+PROBLEM_CACHE_TTL = 60 * 60
+HIDDEN_BUNDLE_CACHE_TTL = 6 * 60 * 60
+
+# In-process layer in front of Redis; short TTL bounds staleness after a bust
+# issued by another process
+LOCAL_CACHE_TTL = 5 * 60
+LOCAL_CACHE_MAXSIZE = 1024
+
+# key -> (expires_at, raw JSON body), least recently used first
+_local_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+# key -> fetch in progress, shared by concurrent misses on the same key
+_inflight: Dict[str, "asyncio.Task[bytes]"] = {}
+
+
+def _problem_key(problem_id: str) -> str:
+    return f"pb:prob:{problem_id}:v1"
+
+
+def _hidden_bundle_key(problem_id: str) -> str:
+    return f"pb:hidden:{problem_id}:v1"
 
 
 class ProblemBankClient:
     """Client for interacting with Problem Bank service."""
 
+    # Sent on every call; baked into the pooled client once
+    _HEADERS: ClassVar[Dict[str, str]] = {
+        "X-Service": "curriculum-orchestrator",
+        "Content-Type": "application/json",
+    }
+
     def __init__(self):
-        self.settings = get_settings()
-        self.base_url = self.settings.problem_bank_base
+        self.base_url = _BASE_URL
         self.timeout = httpx.Timeout(30.0)
 
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Pooled client shared by every instance talking to this service."""
+        return get_http_client(self.base_url, self.timeout, self._HEADERS)
+
+    async def _cached_get(self, key: str, path: str, ttl: int) -> Dict[str, Any]:
+        """GET ``path`` through the local and Redis caches.
+
+        Concurrent misses on the same key share a single upstream fetch. Each
+        call gets a freshly decoded dict, so callers may mutate the result.
+        """
+        entry = _local_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            _local_cache.move_to_end(key)
+            return cast(Dict[str, Any], orjson.loads(entry[1]))
+
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_body(key, path, ttl))
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+        # A cancelled caller must not cancel the fetch other callers wait on
+        body = await asyncio.shield(task)
+        return cast(Dict[str, Any], orjson.loads(body))
+
+    async def _fetch_body(self, key: str, path: str, ttl: int) -> bytes:
+        """Fetch the raw JSON body from Redis or the service, caching it for ``ttl``.
+
+        Cache errors are ignored so a Redis outage only costs the HTTP call.
+        """
+        redis = await get_redis()
+        try:
+            body = await redis.get(key)
+        except RedisError:
+            body = None
+        if body is None:
+            response = await self._client.get(path)
+            response.raise_for_status()
+            body = response.content
+            try:
+                await redis.setex(key, ttl, body)
+            except RedisError:
+                pass
+
+        _local_cache[key] = (time.monotonic() + min(ttl, LOCAL_CACHE_TTL), body)
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > LOCAL_CACHE_MAXSIZE:
+            _local_cache.popitem(last=False)
+        return cast(bytes, body)
+
     async def get_problem(self, problem_id: str) -> Dict[str, Any]:
         """Get problem metadata and content."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/internal/problems/{problem_id}",
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return cast(Dict[str, Any], response.json())
+        return await self._cached_get(
+            _problem_key(problem_id),
+            f"/internal/problems/{problem_id}",
+            PROBLEM_CACHE_TTL,
+        )
 
     async def get_hidden_bundle(self, problem_id: str) -> Dict[str, Any]:
         """Get hidden test bundle for a problem (internal only)."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/internal/problems/{problem_id}/hidden-bundle",
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return cast(Dict[str, Any], response.json())
+        return await self._cached_get(
+            _hidden_bundle_key(problem_id),
+            f"/internal/problems/{problem_id}/hidden-bundle",
+            HIDDEN_BUNDLE_CACHE_TTL,
+        )
+
+    async def cache_bust(self, problem_id: str) -> None:
+        """Drop cached problem content and hidden bundle after an update.
+
+        Other processes keep their local copy for up to ``LOCAL_CACHE_TTL``.
+        """
+        keys = (_problem_key(problem_id), _hidden_bundle_key(problem_id))
+        for key in keys:
+            _local_cache.pop(key, None)
+        redis = await get_redis()
+        await redis.delete(*keys)
 
     async def get_problems_by_subject(
         self,
@@ -49,24 +143,15 @@ class ProblemBankClient:
         if track_id:
             params["track_id"] = str(track_id)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/internal/problems",
-                params=params,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return cast(List[Dict[str, Any]], response.json()["items"])
+        response = await self._client.get("/internal/problems", params=params)
+        response.raise_for_status()
+        return cast(List[Dict[str, Any]], orjson.loads(response.content)["items"])
 
     async def get_track(self, slug: str) -> Dict[str, Any]:
         """Fetch a track definition by slug from Problem Bank."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/internal/tracks/{slug}",
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return cast(Dict[str, Any], response.json())
+        response = await self._client.get(f"/internal/tracks/{slug}")
+        response.raise_for_status()
+        return cast(Dict[str, Any], orjson.loads(response.content))
 
     async def get_problems_by_module(
         self,
@@ -94,18 +179,8 @@ class ProblemBankClient:
         if difficulty is not None:
             params["difficulty"] = difficulty
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/internal/problems",
-                params=params,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return cast(List[Dict[str, Any]], response.json().get("items", []))
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for internal API calls."""
-        return {
-            "X-Service": "curriculum-orchestrator",
-            "Content-Type": "application/json",
-        }
+        response = await self._client.get("/internal/problems", params=params)
+        response.raise_for_status()
+        return cast(
+            List[Dict[str, Any]], orjson.loads(response.content).get("items", [])
+        )
@@ -0,0 +1,38 @@
+"""Shared Redis client."""
+
+from typing import Optional
+
+from co.config import get_settings
+from redis import asyncio as aioredis
+
+# Every caller treats RedisError as "skip the cache / fall back locally"; short
+# socket timeouts turn a slow or unreachable Redis into that error instead of
+# stalling the request
+REDIS_CONNECT_TIMEOUT = 0.25
+REDIS_SOCKET_TIMEOUT = 0.5
+
+_redis: Optional[aioredis.Redis] = None
+
+
+async def get_redis() -> aioredis.Redis:
+    """Return the process-wide Redis client.
+
+    The client owns a connection pool, so it is created once and shared by every
+    service instead of opening a new pool per request.
+    """
+    global _redis
+    if _redis is None:
+        _redis = await aioredis.from_url(
+            get_settings().redis_url,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client (called on application shutdown)."""
+    global _redis
+    client, _redis = _redis, None
+    if client is not None:
+        await client.aclose()
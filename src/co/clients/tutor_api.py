@@ -1,33 +1,126 @@
 """Tutor API client for LLM interactions."""
 
-from typing import Any, Dict, cast
+import asyncio
+from typing import Any, ClassVar, Dict, List, Optional, cast
 
 import httpx
+import orjson
+from co.clients.http import get_http_client
 from co.config import get_settings
 
+# Settings are frozen, so the base URL is read once at import
+_BASE_URL = get_settings().tutor_base
+
+# First retry delay for analysis requests; doubles on each further retry
+ANALYZE_RETRY_BACKOFF = 0.1
+
 
 class TutorAPIClient:
     """Client for tutor/LLM service."""
 
-    def __init__(self):
-        self.settings = get_settings()
-        self.base_url = self.settings.tutor_base
+    # Sent on every call; baked into the pooled client once
+    _HEADERS: ClassVar[Dict[str, str]] = {
+        "X-Service": "curriculum-orchestrator",
+        "Content-Type": "application/json",
+    }
+
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self.base_url = _BASE_URL
         self.timeout = httpx.Timeout(30.0)
+        self._own_client = http_client
+
+    @classmethod
+    def standalone(cls) -> "TutorAPIClient":
+        """Client with its own connection pool instead of the shared one.
+
+        For event loops that end with the call (e.g. ``asyncio.run`` in a
+        worker thread), whose connections must not land in the shared pool.
+        Close it with ``aclose`` before the loop ends.
+        """
+        return cls(
+            httpx.AsyncClient(
+                base_url=_BASE_URL,
+                timeout=httpx.Timeout(30.0),
+                headers=cls._HEADERS,
+            )
+        )
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Own client if given, else the pool shared by every instance."""
+        if self._own_client is not None:
+            return self._own_client
+        return get_http_client(self.base_url, self.timeout, self._HEADERS)
+
+    async def aclose(self) -> None:
+        """Close the client's own connection pool; the shared pool is left open."""
+        if self._own_client is not None:
+            await self._own_client.aclose()
 
     async def create_turn(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new tutor turn."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/turns",
-                json=request,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return cast(Dict[str, Any], response.json())
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API calls."""
-        return {
-            "X-Service": "curriculum-orchestrator",
-            "Content-Type": "application/json",
+        response = await self._client.post("/turns", content=orjson.dumps(request))
+        response.raise_for_status()
+        return cast(Dict[str, Any], orjson.loads(response.content))
+
+    async def analyze_code(
+        self,
+        prompt: str,
+        response_format: str = "text",
+        timeout: float = 30.0,
+        max_retries: int = 0,
+        max_output_tokens: Optional[int] = None,
+    ) -> str:
+        """Run one code analysis prompt and return the raw model output."""
+        body = {
+            "prompt": prompt,
+            "response_format": response_format,
+            "max_output_tokens": max_output_tokens,
         }
+        result = await self._post_analysis("/analyze", body, timeout, max_retries)
+        return cast(str, result["content"])
+
+    async def analyze_code_batch(
+        self,
+        prompts: List[str],
+        response_format: str = "text",
+        timeout: float = 30.0,
+        max_retries: int = 0,
+        max_output_tokens: Optional[int] = None,
+    ) -> List[str]:
+        """Run several analysis prompts in one request.
+
+        Outputs are returned in the same order as ``prompts``.
+        """
+        body = {
+            "prompts": prompts,
+            "response_format": response_format,
+            "max_output_tokens": max_output_tokens,
+        }
+        result = await self._post_analysis("/analyze/batch", body, timeout, max_retries)
+        return cast(List[str], result["contents"])
+
+    async def _post_analysis(
+        self, path: str, body: Dict[str, Any], timeout: float, max_retries: int
+    ) -> Dict[str, Any]:
+        """POST an analysis request with a per-attempt timeout.
+
+        Timeouts, transport errors and 5xx responses are retried up to
+        ``max_retries`` times with exponential backoff; 4xx responses are not.
+        """
+        content = orjson.dumps(body)
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self._client.post(
+                    path, content=content, timeout=timeout
+                )
+                response.raise_for_status()
+                return cast(Dict[str, Any], orjson.loads(response.content))
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                retryable = not isinstance(exc, httpx.HTTPStatusError) or (
+                    exc.response.status_code >= 500
+                )
+                if not retryable or attempt == max_retries:
+                    raise
+            await asyncio.sleep(ANALYZE_RETRY_BACKOFF * 2**attempt)
+        raise AssertionError("unreachable")
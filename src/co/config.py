@@ -14,6 +14,8 @@ class Settings(BaseSettings):
         case_sensitive=False,
         env_file=".env",
         env_file_encoding="utf-8",
+        # Immutable after load so values can be snapshotted at import time
+        frozen=True,
     )
 
     # Application
@@ -24,8 +26,10 @@ class Settings(BaseSettings):
     # Database
     # Default to Postgres; tests may override via CO_DB_URL
     db_url: str = "postgresql+asyncpg://localhost/scimigo_co"
-    db_pool_size: int = 10
-    db_max_overflow: int = 20
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds before a connection is replaced
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
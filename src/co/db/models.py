@@ -1,21 +1,25 @@
 """SQLAlchemy ORM models."""
 
-from datetime import datetime
-from uuid import uuid4
-
-from co.db.base import Base
+from co.db.base import IS_SQLITE, Base, uuid7
 from sqlalchemy import (
     JSON,
     CheckConstraint,
     Column,
+    Computed,
+    Date,
     DateTime,
+    Enum,
+    FetchedValue,
     Float,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
@@ -23,29 +27,40 @@ from sqlalchemy.orm import relationship
 # Use JSONB on Postgres and fallback to generic JSON elsewhere
 JSONType = JSON().with_variant(JSONB, "postgresql")
 
+# Native Postgres enums for small closed value sets (4 bytes per value)
+SubjectType = Enum("coding", "math", "systems", name="subject")
+SessionModeType = Enum("practice", "mock", "track", name="session_mode")
+SubmissionStatusType = Enum(
+    "passed", "failed", "timeout", "error", name="submission_status"
+)
+
 
 class Track(Base):
     """Track/curriculum model."""
 
     __tablename__ = "tracks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    slug = Column(String, unique=True, nullable=False)
-    subject = Column(String, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    slug = Column(String(100), unique=True, nullable=False)
+    subject = Column(SubjectType, nullable=False)
     title = Column(Text, nullable=False)
     labels = Column(JSONType, nullable=False, default=list)
     modules = Column(JSONType, nullable=False, default=list)
     version = Column(String, nullable=False, default="v1")
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
     # Relationships
     sessions = relationship("Session", back_populates="track")
 
     __table_args__ = (
-        CheckConstraint(
-            "subject IN ('coding', 'math', 'systems')", name="check_subject"
+        # jsonb_path_ops only serves containment (@>) lookups
+        Index(
+            "idx_tracks_labels",
+            "labels",
+            postgresql_using="gin",
+            postgresql_ops={"labels": "jsonb_path_ops"},
         ),
     )
 
@@ -55,19 +70,22 @@ class Session(Base):
 
     __tablename__ = "sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), nullable=False)
-    subject = Column(String, nullable=False)
-    mode = Column(String, nullable=False)
+    subject = Column(SubjectType, nullable=False)
+    mode = Column(SessionModeType, nullable=False)
     track_id = Column(UUID(as_uuid=True), ForeignKey("tracks.id"), nullable=True)
-    problem_id = Column(String, nullable=True)
+    problem_id = Column(String(100), nullable=True)
     status = Column(String, nullable=False, default="active")
     last_hint_level = Column(Integer, nullable=False, default=0)
     started_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     # Relationships
@@ -75,11 +93,7 @@ class Session(Base):
     submissions = relationship("Submission", back_populates="session")
 
     __table_args__ = (
-        CheckConstraint(
-            "subject IN ('coding', 'math', 'systems')", name="check_session_subject"
-        ),
-        CheckConstraint("mode IN ('practice', 'mock', 'track')", name="check_mode"),
-        Index("idx_sessions_user", "user_id"),
+        Index("idx_sessions_user_subject", "user_id", "subject"),
         Index("idx_sessions_track", "track_id"),
     )
 
@@ -89,17 +103,17 @@ class Submission(Base):
 
     __tablename__ = "submissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey("sessions.id", ondelete="CASCADE"),
         nullable=False,
     )
     user_id = Column(UUID(as_uuid=True), nullable=False)
-    problem_id = Column(String, nullable=False)
-    subject = Column(String, nullable=False)
-    language = Column(String, nullable=True)
-    status = Column(String, nullable=False)
+    problem_id = Column(String(100), nullable=False)
+    subject = Column(SubjectType, nullable=False)
+    language = Column(String(50), nullable=True)
+    status = Column(SubmissionStatusType, nullable=False)
     visible_passed = Column(Integer, nullable=False, default=0)
     visible_total = Column(Integer, nullable=False, default=0)
     hidden_passed = Column(Integer, nullable=False, default=0)
@@ -109,9 +123,24 @@ class Submission(Base):
     pillar_scores = Column(JSONType, nullable=True)
     signal_metadata = Column(JSONType, nullable=True)
     feedback = Column(JSONType, nullable=True)
-    payload_sha256 = Column(String, nullable=True)
+    # Raw SHA-256 digest (bytea), not hex
+    payload_sha256 = Column(LargeBinary(32), nullable=True)
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    # UTC month of created_at, generated by the database (same expression as
+    # migration 162d8480bd8d); SQLite has no date_trunc, so tests only map it
+    created_month = Column(
+        Date,
+        (
+            FetchedValue()
+            if IS_SQLITE
+            else Computed(
+                "(date_trunc('month', created_at AT TIME ZONE 'UTC'))::date",
+                persisted=True,
+            )
+        ),
+        nullable=True,
     )
 
     # Relationships
@@ -119,15 +148,23 @@ class Submission(Base):
     rubric_scores = relationship("RubricScore", back_populates="submission")
 
     __table_args__ = (
-        CheckConstraint(
-            "subject IN ('coding', 'math', 'systems')", name="check_submission_subject"
+        # Session lookups plus the identical-resubmission check in submit_attempt
+        Index("idx_submissions_session_payload", "session_id", "payload_sha256"),
+        Index("idx_submissions_user", "user_id"),
+        # Covers "latest attempt per user+problem" without a heap fetch or sort
+        Index(
+            "idx_submissions_user_problem_recent",
+            "user_id",
+            "problem_id",
+            text("created_at DESC"),
+            postgresql_include=["status"],
         ),
-        CheckConstraint(
-            "status IN ('passed', 'failed', 'timeout', 'error')", name="check_status"
+        Index(
+            "brin_submissions_created",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
         ),
-        Index("idx_submissions_session", "session_id"),
-        Index("idx_submissions_user", "user_id"),
-        Index("idx_submissions_problem", "problem_id"),
     )
 
 
@@ -142,7 +179,10 @@ class Mastery(Base):
     score = Column(Integer, nullable=False)
     ema = Column(Float, nullable=False, default=0.0)
     updated_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     __table_args__ = (
@@ -157,19 +197,19 @@ class ReviewQueue(Base):
 
     __tablename__ = "review_queue"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), nullable=False)
-    problem_id = Column(String, nullable=False)
-    reason = Column(String, nullable=False)
+    problem_id = Column(String(100), nullable=False)
+    reason = Column(String(50), nullable=False)
     next_due_at = Column(DateTime(timezone=True), nullable=False)
     bucket = Column(Integer, nullable=False, default=0)
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
     __table_args__ = (
         UniqueConstraint("user_id", "problem_id", name="unique_user_problem"),
-        Index("idx_review_due", "next_due_at"),
+        Index("idx_review_due_user", "user_id", "next_due_at"),
     )
 
 
@@ -178,13 +218,13 @@ class Rubric(Base):
 
     __tablename__ = "rubrics"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     domain = Column(String, nullable=False)
     title = Column(Text, nullable=False)
     dimensions = Column(JSONType, nullable=False)
     meta_data = Column(JSONType, nullable=False, default=dict)
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
     # Relationships
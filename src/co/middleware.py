@@ -1,45 +1,59 @@
 """Custom middleware for request handling."""
 
+import asyncio
 import time
 import uuid
-from typing import Awaitable, Callable
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
 
 import jwt
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from co.auth import decode_token, parse_uuid
+from co.clients.redis import REDIS_SOCKET_TIMEOUT, get_redis
 from co.config import get_settings
 
+# Probe and docs endpoints: never authenticated or rate limited
+PUBLIC_PATH_PREFIXES = ("/health", "/metrics", "/docs", "/openapi.json", "/redoc")
+
+# Seconds the rate limiter uses only its local window after a Redis failure,
+# so an outage does not add a Redis timeout to every request
+REDIS_RETRY_COOLDOWN = 5.0
+
 
 class AuthMiddleware(BaseHTTPMiddleware):
     """Extract user ID from JWT and attach to request state."""
 
-    def __init__(self, app):
-        super().__init__(app)
-        self.settings = get_settings()
-
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
+        if request.url.path.startswith(PUBLIC_PATH_PREFIXES):
+            return await call_next(request)
+
         auth = request.headers.get("Authorization")
         if auth and auth.startswith("Bearer "):
             token = auth.split(" ", 1)[1]
             try:
-                payload = jwt.decode(
-                    token,
-                    self.settings.jwt_public_key or "secret",
-                    algorithms=[self.settings.jwt_algorithm],
-                    audience=self.settings.jwt_audience,
-                    issuer=self.settings.jwt_issuer,
-                )
+                # Cached per token digest; only a cache miss verifies the signature
+                payload = decode_token(token)
                 user_id = payload.get("sub")
                 if not user_id:
                     return JSONResponse(
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         content={"detail": "Invalid token: missing user ID"},
                     )
-                request.state.user_id = user_id
+                parsed_user_id = parse_uuid(user_id)
+                if parsed_user_id is None:
+                    return JSONResponse(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        content={"detail": "Invalid user ID format"},
+                    )
+                # Stored as a UUID so get_current_user can pass it through
+                request.state.user_id = parsed_user_id
             except jwt.ExpiredSignatureError:
                 return JSONResponse(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -69,36 +83,103 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Simple in-memory rate limiting middleware."""
+    """Fixed-window rate limiting shared across workers through Redis.
+
+    Each user gets one counter per window (``INCR`` + ``EXPIRE`` in a single
+    round trip), so the limit holds no matter how many processes serve
+    traffic. If Redis is unreachable the middleware falls back to a
+    per-process sliding window rather than rejecting or waving through, and
+    stays on it for ``REDIS_RETRY_COOLDOWN`` seconds before trying Redis again.
+    """
 
     def __init__(self, app):
         super().__init__(app)
-        self.requests = {}
+        # Fallback per-user request timestamps, oldest first
+        self.requests: Dict[Any, Deque[float]] = {}
+        self._last_sweep = time.time()
         self.settings = get_settings()
+        self._redis: Optional[aioredis.Redis] = None
+        # Redis is skipped until this time after a failure
+        self._redis_retry_at = 0.0
+
+    async def _get_redis(self) -> aioredis.Redis:
+        """Get Redis connection."""
+        if self._redis is None:
+            self._redis = await get_redis()
+        return self._redis
+
+    async def _count_shared(self, user_id: Any, current_time: float) -> int:
+        """Count this request in the user's current Redis window."""
+        window = self.settings.rate_limit_window
+        key = f"rl:{user_id}:{int(current_time // window)}"
+        redis = await self._get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, window)
+            count, _ = await pipe.execute()
+        return int(count)
+
+    def _sweep_local(self, window_start: float) -> None:
+        """Drop users with no requests left in the window.
+
+        Entries are otherwise only trimmed when the same user returns, so
+        one-off callers would accumulate forever.
+        """
+        for user_id, timestamps in list(self.requests.items()):
+            if not timestamps or timestamps[-1] <= window_start:
+                del self.requests[user_id]
+
+    def _count_local(self, user_id: Any, current_time: float) -> int:
+        """Count this request in the in-process sliding window."""
+        window_start = current_time - self.settings.rate_limit_window
+        # At most one sweep per window, so the cost amortizes to O(1)
+        if self._last_sweep <= window_start:
+            self._sweep_local(window_start)
+            self._last_sweep = current_time
+
+        timestamps = self.requests.get(user_id)
+        if timestamps is None:
+            timestamps = self.requests[user_id] = deque(
+                maxlen=self.settings.rate_limit_requests
+            )
+
+        # Expire entries that fell out of the window from the old end
+        while timestamps and timestamps[0] <= window_start:
+            timestamps.popleft()
+
+        if len(timestamps) >= self.settings.rate_limit_requests:
+            return len(timestamps) + 1
+
+        # Record request
+        timestamps.append(current_time)
+        return len(timestamps)
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
-        # Skip rate limiting for health checks
-        if request.url.path == "/health":
+        # Skip rate limiting for health checks and docs
+        if request.url.path.startswith(PUBLIC_PATH_PREFIXES):
             return await call_next(request)
 
         # Get user ID from request state set by AuthMiddleware
         user_id = getattr(request.state, "user_id", "anonymous")
 
         current_time = time.time()
-        window_start = current_time - self.settings.rate_limit_window
-
-        # Clean old entries
-        if user_id in self.requests:
-            self.requests[user_id] = [
-                ts for ts in self.requests[user_id] if ts > window_start
-            ]
-        else:
-            self.requests[user_id] = []
+        count: Optional[int] = None
+        if current_time >= self._redis_retry_at:
+            # Bounded so a slow Redis (including client-side reconnect retries)
+            # falls back like an unreachable one instead of stalling the request
+            try:
+                count = await asyncio.wait_for(
+                    self._count_shared(user_id, current_time), REDIS_SOCKET_TIMEOUT
+                )
+            except (RedisError, asyncio.TimeoutError):
+                self._redis_retry_at = current_time + REDIS_RETRY_COOLDOWN
+        if count is None:
+            count = self._count_local(user_id, current_time)
 
         # Check rate limit
-        if len(self.requests[user_id]) >= self.settings.rate_limit_requests:
+        if count > self.settings.rate_limit_requests:
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
@@ -110,7 +191,4 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 },
             )
 
-        # Record request
-        self.requests[user_id].append(current_time)
-
         return await call_next(request)
@@ -1,14 +1,11 @@
 """Study path model."""
 
-from datetime import datetime
-from uuid import uuid4
-
-from sqlalchemy import Column, DateTime, Index, String
+from sqlalchemy import Column, DateTime, Index, String, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import JSON
 
-from co.db.base import Base
+from co.db.base import Base, uuid7
 
 # JSONB for Postgres with JSON fallback
 JSONType = JSON().with_variant(JSONB, "postgresql")
@@ -19,23 +16,28 @@ class StudyPath(Base):
 
     __tablename__ = "study_paths"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), nullable=False)
     track_id = Column(String(100), nullable=False, default="coding-interview-meta")
     config = Column(JSONType, nullable=False, default=dict)
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
-    # Relationships
+    # Relationships. Never loaded implicitly: use selectinload(StudyPath.tasks)
+    # where tasks are needed; deletes rely on the FK's ON DELETE CASCADE.
     tasks = relationship(
         "StudyTask",
         back_populates="path",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     __table_args__ = (Index("idx_study_paths_user", "user_id", "created_at"),)
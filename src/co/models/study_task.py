@@ -1,8 +1,6 @@
 """Study task model."""
 
 import enum
-from datetime import datetime
-from uuid import uuid4
 
 from sqlalchemy import (
     CheckConstraint,
@@ -14,12 +12,14 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
 
-from co.db.base import Base
+from co.db.base import Base, uuid7
 
 # JSONB for Postgres with JSON fallback
 JSONType = JSON().with_variant(JSONB, "postgresql")
@@ -40,7 +40,7 @@ class StudyTask(Base):
 
     __tablename__ = "study_tasks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     path_id = Column(
         UUID(as_uuid=True),
         ForeignKey("study_paths.id", ondelete="CASCADE"),
@@ -63,7 +63,7 @@ class StudyTask(Base):
     hints_used = Column(Integer, nullable=False, default=0)
     meta = Column("metadata", JSONType, nullable=False, default=dict)
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
     # Relationships
@@ -78,6 +78,26 @@ class StudyTask(Base):
     __table_args__ = (
         CheckConstraint("difficulty >= 1 AND difficulty <= 5", name="check_difficulty"),
         Index("idx_study_tasks_path_schedule", "path_id", "scheduled_at"),
+        # Serves get_next_task: only scheduled tasks, already in schedule order
+        Index(
+            "idx_study_tasks_next_scheduled",
+            "path_id",
+            "scheduled_at",
+            postgresql_where=text("status = 'scheduled'"),
+        ),
         Index("idx_study_tasks_path_module_status", "path_id", "module", "status"),
         Index("idx_study_tasks_problem", "problem_id"),
+        # jsonb_path_ops: filter with .contains([...]) (@>), not ? / ->
+        Index(
+            "idx_study_tasks_topic_tags",
+            "topic_tags",
+            postgresql_using="gin",
+            postgresql_ops={"topic_tags": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_study_tasks_metadata",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
     )
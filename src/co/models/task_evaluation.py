@@ -1,24 +1,26 @@
 """Task evaluation model."""
 
 from datetime import datetime
-from uuid import uuid4
 
 from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import JSON
 
-from co.db.base import Base
+from co.db.base import Base, uuid7
 
 JSONType = JSON().with_variant(JSONB, "postgresql")
 
 
 class TaskEvaluation(Base):
-    """Evaluation results for a study task submission."""
+    """Evaluation results for a study task submission.
+
+    RANGE-partitioned by month on ``created_at``.
+    """
 
     __tablename__ = "task_evaluations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     task_id = Column(
         UUID(as_uuid=True),
         ForeignKey("study_tasks.id", ondelete="CASCADE"),
@@ -34,11 +36,24 @@ class TaskEvaluation(Base):
     runtime_ms = Column(Integer, nullable=True)
     memory_mb = Column(Integer, nullable=True)
     error_message = Column(Text, nullable=True)
+    # Partition key; part of the primary key on the partitioned table
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        default=datetime.utcnow,
     )
     meta = Column("metadata", JSONType, nullable=False, default=dict)
 
     task = relationship("StudyTask", back_populates="evaluations")
 
-    __table_args__ = (Index("idx_task_eval_task", "task_id", "created_at"),)
+    __table_args__ = (
+        Index("idx_task_eval_task", "task_id"),
+        # Append-only, time-ordered: BRIN is a fraction of a BTREE's size
+        Index(
+            "brin_task_evaluations_created",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
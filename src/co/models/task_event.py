@@ -2,14 +2,13 @@
 
 import enum
 from datetime import datetime
-from uuid import uuid4
 
 from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
 
-from co.db.base import Base
+from co.db.base import Base, uuid7
 
 JSONType = JSON().with_variant(JSONB, "postgresql")
 
@@ -27,11 +26,11 @@ class TaskEventType(enum.Enum):
 
 
 class TaskEvent(Base):
-    """Event log for study tasks."""
+    """Event log for study tasks, RANGE-partitioned by month on created_at."""
 
     __tablename__ = "task_events"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     task_id = Column(
         UUID(as_uuid=True),
         ForeignKey("study_tasks.id", ondelete="CASCADE"),
@@ -41,10 +40,30 @@ class TaskEvent(Base):
         Enum(TaskEventType, name="task_event_type"), nullable=False
     )
     payload = Column(JSONType, nullable=False, default=dict)
+    # Partition key; part of the primary key on the partitioned table
     created_at = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        default=datetime.utcnow,
     )
 
     task = relationship("StudyTask", back_populates="events")
 
-    __table_args__ = (Index("idx_task_events_task", "task_id", "created_at"),)
+    __table_args__ = (
+        Index("idx_task_events_task", "task_id"),
+        # Append-only, time-ordered: BRIN is a fraction of a BTREE's size
+        Index(
+            "brin_task_events_created",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # jsonb_path_ops: filter with .contains({...}) (@>), not ->> equality
+        Index(
+            "idx_task_events_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+    )
@@ -36,8 +36,8 @@ async def update_session(
     service = SessionService(db)
 
     # Verify session ownership
-    session = await service.get_session(session_id)
-    if not session or session.user_id != user_id:
+    session = await service.get_session_for_user(session_id, user_id)
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     # Update based on action
@@ -61,9 +61,9 @@ async def get_session(
 ) -> Session:
     """Get session details."""
     service = SessionService(db)
-    session = await service.get_session(session_id)
+    session = await service.get_session_for_user(session_id, user_id)
 
-    if not session or session.user_id != user_id:
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     return session
@@ -1,6 +1,7 @@
 """Submission handling endpoints."""
 
-from typing import Union
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple, Type, Union
 from uuid import UUID
 
 from co.auth import get_current_user
@@ -14,47 +15,115 @@ from co.services.evaluators.coding import CodingEvaluator
 from co.services.evaluators.math import MathEvaluator
 from co.services.sessions import SessionService
 from co.services.study_task import StudyTaskService
+from co.services.submissions import (
+    SubmissionService,
+    coding_payload_digest,
+    math_payload_digest,
+)
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
+Evaluator = Union[CodingEvaluator, MathEvaluator]
+
+# subject -> (evaluator, payload fields passed through to evaluate())
+_EVALUATORS: Dict[str, Tuple[Type[Evaluator], Tuple[str, ...]]] = {
+    "coding": (CodingEvaluator, ("language", "code")),
+    "math": (MathEvaluator, ("steps", "expression")),
+}
+
+# Per-process cap on evaluations in flight for a single user
+MAX_CONCURRENT_EVALUATIONS = 2
+
+# user_id -> evaluations in flight; entries are dropped when they reach zero
+_active_evaluations: Dict[UUID, int] = {}
+
+
+@contextmanager
+def _evaluation_slot(user_id: UUID) -> Iterator[bool]:
+    """Hold one of the user's evaluation slots; yields False if none is free."""
+    active = _active_evaluations.get(user_id, 0)
+    if active >= MAX_CONCURRENT_EVALUATIONS:
+        yield False
+        return
+
+    _active_evaluations[user_id] = active + 1
+    try:
+        yield True
+    finally:
+        remaining = _active_evaluations[user_id] - 1
+        if remaining:
+            _active_evaluations[user_id] = remaining
+        else:
+            del _active_evaluations[user_id]
+
 
 @router.post("", response_model=SubmissionResult)
 async def submit_attempt(
     submission: Union[SubmissionCodingCreate, SubmissionMathCreate],
     db: AsyncSession = Depends(get_db),
     user_id: UUID = Depends(get_current_user),
-) -> SubmissionResult:
+) -> SubmissionResult | JSONResponse:
     """Submit an attempt for evaluation (subject-agnostic)."""
     # Verify session ownership
     session_service = SessionService(db)
-    session = await session_service.get_session(submission.session_id)
+    session = await session_service.get_session_for_user(submission.session_id, user_id)
 
-    if not session or session.user_id != user_id:
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Route to appropriate evaluator based on subject
+    # Hashed once here and handed to the evaluator. A resubmission of an
+    # identical payload replays the stored grade instead of tying up this
+    # worker on another eval_service run; it is still recorded as an attempt
     if submission.subject == "coding":
-        coding_evaluator = CodingEvaluator(db)
-        result = await coding_evaluator.evaluate(
-            session_id=submission.session_id,
-            problem_id=submission.problem_id,
-            language=submission.payload.language,
-            code=submission.payload.code,
-            user_id=user_id,
+        payload_sha256 = coding_payload_digest(
+            submission.payload.language, submission.payload.code
+        )
+    else:
+        payload_sha256 = math_payload_digest(
+            submission.payload.steps, submission.payload.expression
         )
-    elif submission.subject == "math":
-        math_evaluator = MathEvaluator(db)
-        result = await math_evaluator.evaluate(
-            session_id=submission.session_id,
-            problem_id=submission.problem_id,
-            steps=submission.payload.steps,
-            expression=submission.payload.expression,
-            user_id=user_id,
+    submission_service = SubmissionService(db)
+    previous = await submission_service.find_previous_attempt(
+        submission.session_id, submission.problem_id, payload_sha256
+    )
+    if previous is not None:
+        result = submission_service.record_replay(
+            previous, submission.session_id, payload_sha256
         )
     else:
-        raise HTTPException(status_code=400, detail="Invalid subject")
+        # Bound how many evaluations one user can hold open at once, so a single
+        # client cannot tie up workers and pool connections
+        with _evaluation_slot(user_id) as acquired:
+            if not acquired:
+                return JSONResponse(
+                    status_code=429,
+                    content={
+                        "error": {
+                            "code": "MAX_EVALUATIONS",
+                            "message": "Maximum concurrent evaluations reached",
+                            "details": {"max_evaluations": MAX_CONCURRENT_EVALUATIONS},
+                        }
+                    },
+                )
+
+            # Route to appropriate evaluator based on subject
+            evaluator = _EVALUATORS.get(submission.subject)
+            if evaluator is None:
+                raise HTTPException(status_code=400, detail="Invalid subject")
+            evaluator_cls, payload_fields = evaluator
+            result = await evaluator_cls(db).evaluate(
+                session_id=submission.session_id,
+                problem_id=submission.problem_id,
+                user_id=user_id,
+                payload_sha256=payload_sha256,
+                **{
+                    field: getattr(submission.payload, field)
+                    for field in payload_fields
+                },
+            )
 
     # Update session based on result
     if result.status == "passed":
@@ -65,12 +134,11 @@ async def submit_attempt(
         )
 
     # Record evaluation for study task if provided
-    task_id = getattr(submission, "task_id", None)
-    if task_id:
+    if submission.task_id is not None:
         task_service = StudyTaskService(db)
         try:
             await task_service.record_evaluation(
-                task_id=task_id,
+                task_id=submission.task_id,
                 user_id=user_id,
                 language=submission.payload.language
                 if submission.subject == "coding"
@@ -81,8 +149,12 @@ async def submit_attempt(
                 result=result,
             )
         except ValueError:
+            # Nothing was staged for the task; keep the evaluated submission
+            await db.commit()
             raise HTTPException(status_code=404, detail="Study task not found")
 
+    # Submission, mastery, review queue and task updates land in one commit
+    await db.commit()
     return result
 
 
@@ -93,5 +165,12 @@ async def get_submission(
     user_id: UUID = Depends(get_current_user),
 ) -> SubmissionResult:
     """Get submission details."""
-    # Implementation would fetch from database
-    raise HTTPException(status_code=501, detail="Not implemented yet")
+    submission_service = SubmissionService(db)
+    submission = await submission_service.get_submission_for_user(
+        submission_id, user_id
+    )
+
+    if not submission:
+        raise HTTPException(status_code=404, detail="Submission not found")
+
+    return SubmissionService.to_result(submission)
@@ -1,45 +1,78 @@
 """Track management endpoints."""
 
-from typing import Optional
-from uuid import UUID
+import hashlib
+from typing import Literal, Optional
 
+from co.auth import parse_uuid
 from co.db.base import get_db
 from co.schemas.tracks import Track, TrackList
-from co.services.tracks import TrackService
-from fastapi import APIRouter, Depends, HTTPException, Query
+from co.services.tracks import (
+    TrackService,
+    cache_response,
+    get_cached_response,
+    track_cache_key,
+    track_list_cache_key,
+)
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
 
+def _json_response(request: Request, body: bytes) -> Response:
+    """Serve a rendered body with an ETag, or 304 if the client already has it."""
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
 @router.get("", response_model=TrackList)
 async def list_tracks(
-    subject: Optional[str] = Query(None, regex="^(coding|math|systems)$"),
+    request: Request,
+    subject: Optional[Literal["coding", "math", "systems"]] = Query(None),
     label: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
-) -> TrackList:
+) -> Response:
     """List available tracks with optional filtering."""
-    service = TrackService(db)
-    tracks = await service.list_tracks(subject=subject, label=label)
-    return TrackList(items=[Track.model_validate(t) for t in tracks])
+    cache_key = track_list_cache_key(subject, label)
+    body = await get_cached_response(cache_key)
+
+    if body is None:
+        service = TrackService(db)
+        tracks = await service.list_tracks(subject=subject, label=label)
+        body = TrackList.model_validate({"items": tracks}).model_dump_json().encode()
+        await cache_response(cache_key, body)
+
+    return _json_response(request, body)
 
 
 @router.get("/{track_id}", response_model=Track)
 async def get_track(
+    request: Request,
     track_id: str,
     db: AsyncSession = Depends(get_db),
-) -> Track:
+) -> Response:
     """Get a track by ID or slug."""
-    service = TrackService(db)
+    cache_key = track_cache_key(track_id)
+    body = await get_cached_response(cache_key)
+
+    if body is None:
+        service = TrackService(db)
+
+        # UUIDs are looked up by ID, anything else as a slug; matching the
+        # pattern avoids raising and catching ValueError on every slug request
+        parsed_id = parse_uuid(track_id)
+        if parsed_id is not None:
+            track = await service.get_track_by_id(parsed_id)
+        else:
+            track = await service.get_track_by_slug(track_id)
 
-    # Try as UUID first, then as slug
-    track = None
-    try:
-        track = await service.get_track_by_id(UUID(track_id))
-    except ValueError:
-        track = await service.get_track_by_slug(track_id)
+        if not track:
+            raise HTTPException(status_code=404, detail="Track not found")
 
-    if not track:
-        raise HTTPException(status_code=404, detail="Track not found")
+        body = Track.model_validate(track).model_dump_json().encode()
+        await cache_response(cache_key, body)
 
-    return track
+    return _json_response(request, body)
@@ -13,6 +13,23 @@ from sqlalchemy.ext.asyncio import AsyncSession
 router = APIRouter()
 
 
+def _max_streams_response(max_streams: int, active_streams: int) -> JSONResponse:
+    """429 returned when the user already has the maximum open streams."""
+    return JSONResponse(
+        status_code=429,
+        content={
+            "error": {
+                "code": "MAX_STREAMS",
+                "message": "Maximum concurrent tutor streams reached",
+                "details": {
+                    "max_streams": max_streams,
+                    "active": active_streams,
+                },
+            }
+        },
+    )
+
+
 @router.post("/messages", response_model=TutorStreamResponse)
 async def create_tutor_message(
     message: TutorMessageCreate,
@@ -26,24 +43,16 @@ async def create_tutor_message(
     from co.services.sessions import SessionService
 
     session_service = SessionService(db)
-    session = await session_service.get_session(message.session_id)
+    session = await session_service.get_session_for_user(message.session_id, user_id)
 
-    if not session or session.user_id != user_id:
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Check concurrent SSE streams
+    # Cheap early rejection; create_tutor_turn enforces the limit atomically
+    max_streams = service.settings.max_concurrent_sse
     active_streams = await service.count_active_streams(user_id)
-    if active_streams >= 2:
-        return JSONResponse(
-            status_code=429,
-            content={
-                "error": {
-                    "code": "MAX_STREAMS",
-                    "message": "Maximum concurrent tutor streams reached",
-                    "details": {"max_streams": 2, "active": active_streams},
-                }
-            },
-        )
+    if active_streams >= max_streams:
+        return _max_streams_response(max_streams, active_streams)
 
     # Initialize tutor turn
     stream_data = await service.create_tutor_turn(
@@ -53,6 +62,8 @@ async def create_tutor_message(
         last_eval=message.last_eval,
         user_id=user_id,
     )
+    if stream_data is None:
+        return _max_streams_response(max_streams, max_streams)
 
     # Update session hint level
     await session_service.update_hint_level(message.session_id, message.hint_level)
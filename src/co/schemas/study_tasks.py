@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from co.models import TaskStatus
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StudyTaskCreate(BaseModel):
@@ -43,8 +43,7 @@ class StudyTask(BaseModel):
     hints_used: int
     meta: Dict[str, Any] = {}
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StudyTaskList(BaseModel):
@@ -61,8 +60,7 @@ class ReviewItem(BaseModel):
     next_due_at: datetime
     bucket: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReviewList(BaseModel):
@@ -5,8 +5,10 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from co.clients.http import close_http_clients
+from co.clients.redis import close_redis
 from co.config import get_settings
 from co.db.base import close_db, init_db
 from co.middleware import AuthMiddleware, RateLimitMiddleware, RequestIDMiddleware
@@ -22,6 +24,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     yield
 
     # Shutdown
+    await close_http_clients()
+    await close_redis()
     await close_db()
 
 
@@ -34,6 +38,8 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        # Response bodies are rendered with orjson instead of stdlib json
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -45,9 +51,11 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    app.add_middleware(RequestIDMiddleware)
-    app.add_middleware(AuthMiddleware)
+    # Starlette runs middleware in reverse order of registration: Auth must be
+    # added after RateLimit so the limiter sees request.state.user_id
     app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(AuthMiddleware)
+    app.add_middleware(RequestIDMiddleware)
 
     # Routes
     app.include_router(tracks.router, prefix="/v1/tracks", tags=["tracks"])
@@ -68,7 +76,7 @@ def create_app() -> FastAPI:
     # Root redirect
     @app.get("/")
     async def root():
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "service": "Scimigo Curriculum Orchestrator",
                 "version": "0.1.0",
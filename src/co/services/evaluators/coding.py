@@ -1,7 +1,7 @@
 """Coding problem evaluator service."""
 
-import hashlib
-from typing import Any, Dict, cast
+import asyncio
+from typing import Any, Dict, Optional, cast
 from uuid import UUID
 
 from co.clients.eval_service import EvalServiceClient
@@ -9,8 +9,12 @@ from co.clients.problem_bank import ProblemBankClient
 from co.db.models import Submission as SubmissionModel
 from co.schemas.submissions import HiddenResults, SubmissionResult, VisibleResults
 from co.services.evaluators.meta_signal_extractor import MetaSignalExtractor
+from co.services.submissions import coding_payload_digest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Evaluation statuses that map straight to a single failure category
+_STATUS_CATEGORIES = {"timeout": "timeout", "error": "runtime_error"}
+
 
 class CodingEvaluator:
     """Evaluator for coding problems."""
@@ -27,10 +31,19 @@ class CodingEvaluator:
         language: str,
         code: str,
         user_id: UUID,
+        payload_sha256: Optional[bytes] = None,
     ) -> SubmissionResult:
-        """Evaluate a coding submission."""
-        # Fetch hidden test bundle from problem bank
-        hidden_bundle = await self.problem_bank.get_hidden_bundle(problem_id)
+        """Evaluate a coding submission.
+
+        ``payload_sha256`` may be passed when the caller has already hashed
+        the payload, so it is not hashed twice.
+        """
+        # Fetch hidden test bundle and problem metadata from problem bank
+        # concurrently; the metadata is only needed after evaluation
+        hidden_bundle, problem_metadata = await asyncio.gather(
+            self.problem_bank.get_hidden_bundle(problem_id),
+            self.problem_bank.get_problem(problem_id),
+        )
 
         # Prepare evaluation request
         eval_request = {
@@ -56,10 +69,6 @@ class CodingEvaluator:
             total=eval_result["hidden"]["total"],
             categories=self._extract_failure_categories(eval_result),
         )
-        # Check if this is a Meta track problem and extract signals
-        problem_metadata = await self.problem_bank.get_problem(problem_id)
-        extractor = MetaSignalExtractor()
-
         submission = SubmissionModel(
             session_id=session_id,
             user_id=user_id,
@@ -73,10 +82,13 @@ class CodingEvaluator:
             hidden_total=hidden_results.total,
             categories=hidden_results.categories,
             exec_ms=eval_result.get("exec_ms", 0),
-            payload_sha256=hashlib.sha256(code.encode()).hexdigest(),
+            payload_sha256=payload_sha256 or coding_payload_digest(language, code),
         )
 
-        if extractor._is_meta_track(problem_metadata):
+        # Meta track problems also get interview signals; the extractor (and
+        # its LLM analyzer) is only built for those
+        if MetaSignalExtractor._is_meta_track(problem_metadata):
+            extractor = MetaSignalExtractor()
             test_results = {
                 "visible_passed": visible_results.passed,
                 "visible_total": visible_results.total,
@@ -85,15 +97,15 @@ class CodingEvaluator:
                 "categories": hidden_results.categories,
                 "status": eval_result["status"],
             }
-            meta_data = extractor.extract_signals(
+            meta_data = await extractor.extract_signals_async(
                 code, language, test_results, problem_metadata
             )
             submission.pillar_scores = meta_data["pillar_scores"]
             submission.signal_metadata = meta_data["signals"]
             submission.feedback = meta_data["feedback"]
 
+        # Committed by the caller together with the session and task updates
         self.db.add(submission)
-        await self.db.commit()
 
         return SubmissionResult(
             status=eval_result["status"],
@@ -106,19 +118,15 @@ class CodingEvaluator:
 
     def _extract_failure_categories(self, eval_result: Dict[str, Any]) -> list[str]:
         """Extract failure categories from evaluation result."""
-        categories = []
-
-        if eval_result["status"] == "timeout":
-            categories.append("timeout")
-        elif eval_result["status"] == "error":
-            categories.append("runtime_error")
-        elif eval_result["status"] == "failed":
-            # Analyze failure patterns
-            if eval_result["hidden"]["passed"] == 0:
-                categories.append("logic_error")
-            elif eval_result["hidden"]["passed"] < eval_result["hidden"]["total"] / 2:
-                categories.append("edge_cases")
-            else:
-                categories.append("minor_issues")
-
-        return categories
+        status = eval_result["status"]
+        if status in _STATUS_CATEGORIES:
+            return [_STATUS_CATEGORIES[status]]
+        if status != "failed":
+            return []
+
+        # Analyze failure patterns
+        if eval_result["hidden"]["passed"] == 0:
+            return ["logic_error"]
+        if eval_result["hidden"]["passed"] < eval_result["hidden"]["total"] / 2:
+            return ["edge_cases"]
+        return ["minor_issues"]
@@ -1,18 +1,185 @@
 """LLM-based complexity analysis for more accurate signal extraction."""
 
 import asyncio
-import json
-from typing import Any, Dict, Optional
+import hashlib
+import re
+import textwrap
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Set, Tuple
+
+import httpx
+import orjson
+from co.clients.tutor_api import ANALYZE_RETRY_BACKOFF, TutorAPIClient
+
+# First Big-O expression in a free-text (non-JSON) LLM response
+_BIGO_RE = re.compile(r"O\([^)]+\)")
+
+# Successful analyses keyed by content, so identical code skips the LLM call
+ANALYSIS_CACHE_TTL = 60 * 60
+ANALYSIS_CACHE_MAXSIZE = 10_000
+
+# key -> (expires_at, parsed analysis), least recently used first
+_analysis_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _analysis_cache_key(
+    code: str, language: str, problem_context: Optional[str]
+) -> str:
+    material = f"{language}|{problem_context or ''}|{textwrap.dedent(code)}"
+    return hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+
+
+# Concurrent analyses are coalesced into one tutor request: a batch goes out
+# after this window, or as soon as it holds ANALYSIS_BATCH_MAXSIZE prompts
+ANALYSIS_BATCH_WINDOW = 0.02
+ANALYSIS_BATCH_MAXSIZE = 16
+
+# Tutor call budget: two 1.5 s attempts, and a token cap that fits the JSON
+# schema the prompt asks for
+ANALYSIS_REQUEST_TIMEOUT = 1.5
+ANALYSIS_MAX_RETRIES = 1
+ANALYSIS_MAX_OUTPUT_TOKENS = 256
+_ANALYSIS_LIMITS: Dict[str, Any] = {
+    "response_format": "json",
+    "timeout": ANALYSIS_REQUEST_TIMEOUT,
+    "max_retries": ANALYSIS_MAX_RETRIES,
+    "max_output_tokens": ANALYSIS_MAX_OUTPUT_TOKENS,
+}
+
+# Total wait for one analysis: every attempt, the backoff between them and the
+# batch window. Bounds the caller even if the batch never resolves
+ANALYSIS_DEADLINE = (
+    ANALYSIS_REQUEST_TIMEOUT * (ANALYSIS_MAX_RETRIES + 1)
+    + ANALYZE_RETRY_BACKOFF * (2**ANALYSIS_MAX_RETRIES - 1)
+    + ANALYSIS_BATCH_WINDOW
+)
+
+
+class _AnalysisBatcher:
+    """Micro-batcher for LLM analysis prompts on one event loop."""
+
+    def __init__(self) -> None:
+        self._client: Optional[TutorAPIClient] = None
+        # cache key -> (prompt, future); identical prompts share one slot
+        self._pending: Dict[str, Tuple[str, "asyncio.Future[str]"]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._sends: Set["asyncio.Task[None]"] = set()
+
+    def submit(
+        self, client: TutorAPIClient, cache_key: str, prompt: str
+    ) -> "asyncio.Future[str]":
+        """Queue a prompt and return a future for its raw model output."""
+        pending = self._pending.get(cache_key)
+        if pending is not None:
+            return pending[1]
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[str]" = loop.create_future()
+        # Every waiter may have timed out; retrieve the error so it isn't logged
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        if not self._pending:
+            # Analyzers normally share one client; the batch uses whichever
+            # opened it
+            self._client = client
+        self._pending[cache_key] = (prompt, future)
+
+        if len(self._pending) >= ANALYSIS_BATCH_MAXSIZE:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(ANALYSIS_BATCH_WINDOW, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch = list(self._pending.values())
+        self._pending = {}
+        if not batch:
+            return
+        assert self._client is not None
+        send = asyncio.get_running_loop().create_task(self._send(self._client, batch))
+        self._sends.add(send)
+        send.add_done_callback(self._sends.discard)
+
+    async def _send(
+        self,
+        client: TutorAPIClient,
+        batch: List[Tuple[str, "asyncio.Future[str]"]],
+    ) -> None:
+        try:
+            if len(batch) == 1:
+                responses = [
+                    await client.analyze_code(prompt=batch[0][0], **_ANALYSIS_LIMITS)
+                ]
+            else:
+                responses = await client.analyze_code_batch(
+                    prompts=[prompt for prompt, _ in batch], **_ANALYSIS_LIMITS
+                )
+            if len(responses) != len(batch):
+                raise ValueError(
+                    f"Tutor returned {len(responses)} analyses for "
+                    f"{len(batch)} prompts"
+                )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        else:
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+        finally:
+            # Never leave a waiter hanging, even if this task is cancelled
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Analysis batch was not sent"))
+
+
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AnalysisBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_batcher() -> _AnalysisBatcher:
+    """Return the batcher for the running event loop."""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = _batchers[loop] = _AnalysisBatcher()
+    return batcher
+
+
+_shared_tutor_client: Optional[TutorAPIClient] = None
+
 
-from co.clients.tutor_api import TutorAPIClient
+def _get_shared_tutor_client() -> TutorAPIClient:
+    """Return the tutor client shared by every analyzer in the process."""
+    global _shared_tutor_client
+    if _shared_tutor_client is None:
+        _shared_tutor_client = TutorAPIClient()
+    return _shared_tutor_client
 
 
 class LLMComplexityAnalyzer:
     """Analyze code complexity using LLM for more sophisticated understanding."""
 
-    def __init__(self):
-        self.tutor_client = TutorAPIClient()
-        self.timeout = 2.0  # 2 second timeout for LLM analysis
+    def __init__(
+        self, tutor_client: Optional[TutorAPIClient] = None, isolated: bool = False
+    ):
+        """Initialize the analyzer.
+
+        Args:
+            tutor_client: Client to call; defaults to the process-wide one
+            isolated: Bypass the shared batcher and result cache, for use on
+                an event loop other than the application's
+        """
+        self.tutor_client = tutor_client or _get_shared_tutor_client()
+        self.isolated = isolated
 
     async def analyze_complexity(
         self, code: str, language: str, problem_context: Optional[str] = None
@@ -24,19 +191,40 @@ class LLMComplexityAnalyzer:
             Dict with time_complexity, space_complexity, and explanation
         """
 
+        cache_key = _analysis_cache_key(code, language, problem_context)
+        if not self.isolated:
+            entry = _analysis_cache.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                _analysis_cache.move_to_end(cache_key)
+                return dict(entry[1])
+
         prompt = self._build_complexity_prompt(code, language, problem_context)
 
         try:
-            # Use asyncio timeout to prevent blocking
-            async with asyncio.timeout(self.timeout):
-                response = await self.tutor_client.analyze_code(
-                    prompt=prompt, response_format="json"
+            if self.isolated:
+                pending: Awaitable[str] = self.tutor_client.analyze_code(
+                    prompt=prompt, **_ANALYSIS_LIMITS
                 )
-
-            return self._parse_llm_response(response)
-
-        except asyncio.TimeoutError:
-            # Fallback to basic analysis if LLM times out
+            else:
+                # Shielded: a caller that gives up must not cancel a prompt
+                # that other identical submissions are also waiting on
+                pending = asyncio.shield(
+                    _get_batcher().submit(self.tutor_client, cache_key, prompt)
+                )
+            response = await asyncio.wait_for(pending, ANALYSIS_DEADLINE)
+
+            result = self._parse_llm_response(response)
+            if self.isolated:
+                return result
+            # Timeouts and errors below are not cached, so they are retried
+            _analysis_cache[cache_key] = (time.monotonic() + ANALYSIS_CACHE_TTL, result)
+            _analysis_cache.move_to_end(cache_key)
+            while len(_analysis_cache) > ANALYSIS_CACHE_MAXSIZE:
+                _analysis_cache.popitem(last=False)
+            return dict(result)
+
+        except (httpx.TimeoutException, asyncio.TimeoutError):
+            # Fallback to basic analysis if the LLM misses its deadline
             return {
                 "time_complexity": "unknown",
                 "space_complexity": "unknown",
@@ -88,7 +276,7 @@ JSON Response:"""
 
         try:
             # Extract JSON from response
-            result = json.loads(response)
+            result = orjson.loads(response)
 
             # Validate and normalize the response
             return {
@@ -100,11 +288,9 @@ JSON Response:"""
                 "optimizations": result.get("optimizations", []),
             }
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Try to extract complexity from text
-            import re
-
-            time_match = re.search(r"O\([^)]+\)", response)
+            time_match = _BIGO_RE.search(response)
             time_complexity = time_match.group(0) if time_match else "O(n)"
 
             return {
@@ -118,8 +304,8 @@ JSON Response:"""
 class HybridComplexityAnalyzer:
     """Combines AST-based and LLM-based analysis for best results."""
 
-    def __init__(self):
-        self.llm_analyzer = LLMComplexityAnalyzer()
+    def __init__(self, llm_analyzer: Optional[LLMComplexityAnalyzer] = None):
+        self.llm_analyzer = llm_analyzer or LLMComplexityAnalyzer()
 
     async def analyze(
         self,
@@ -193,3 +379,20 @@ class HybridComplexityAnalyzer:
             "confidence": 20,
             "loop_depth": ast_analysis.get("loop_depth", 0),
         }
+
+
+@asynccontextmanager
+async def standalone_hybrid_analyzer() -> AsyncIterator[HybridComplexityAnalyzer]:
+    """Hybrid analyzer that shares no loop-bound state with the application.
+
+    It uses a private tutor connection, closed on exit, and skips the shared
+    batcher and result cache. Use it on short-lived event loops such as
+    ``asyncio.run`` in a worker thread.
+    """
+    tutor_client = TutorAPIClient.standalone()
+    try:
+        yield HybridComplexityAnalyzer(
+            LLMComplexityAnalyzer(tutor_client, isolated=True)
+        )
+    finally:
+        await tutor_client.aclose()
@@ -1,7 +1,6 @@
 """Math problem evaluator service."""
 
-import hashlib
-import json
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from uuid import UUID
 
@@ -9,8 +8,20 @@ from co.clients.eval_service import EvalServiceClient
 from co.clients.problem_bank import ProblemBankClient
 from co.db.models import Submission as SubmissionModel
 from co.schemas.submissions import HiddenResults, SubmissionResult, VisibleResults
+from co.services.submissions import SubmissionService, math_payload_digest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Math adapter error_type -> failure category; anything else is unknown_error
+_ERROR_TYPE_CATEGORIES = {
+    "wrong_answer": "incorrect_answer",
+    "incomplete": "incomplete_solution",
+    "method_error": "incorrect_method",
+}
+
+# Grading is deterministic, so an identical answer from the same user within
+# this window reuses the stored grade instead of calling the math adapter
+MATH_REPLAY_WINDOW = timedelta(minutes=10)
+
 
 class MathEvaluator:
     """Evaluator for math problems."""
@@ -27,9 +38,30 @@ class MathEvaluator:
         steps: Optional[List[str]],
         expression: Optional[str],
         user_id: UUID,
+        payload_sha256: Optional[bytes] = None,
     ) -> SubmissionResult:
-        """Evaluate a math submission."""
-        # Fetch problem metadata and solution
+        """Evaluate a math submission.
+
+        ``payload_sha256`` may be passed when the caller has already hashed
+        the payload, so it is not hashed twice. An identical answer the user
+        submitted within ``MATH_REPLAY_WINDOW`` is recorded against this
+        session with its earlier grade, without re-evaluating it.
+        """
+        payload_sha256 = payload_sha256 or math_payload_digest(steps, expression)
+        submission_service = SubmissionService(self.db)
+        previous = await submission_service.find_recent_attempt(
+            user_id,
+            problem_id,
+            payload_sha256,
+            since=datetime.now(timezone.utc) - MATH_REPLAY_WINDOW,
+        )
+        if previous is not None:
+            return submission_service.record_replay(
+                previous, session_id, payload_sha256
+            )
+
+        # Fetch problem metadata and solution only once grading is needed; the
+        # shielded Problem Bank fetch could not be cancelled on a replay hit
         problem_data = await self.problem_bank.get_problem(problem_id)
 
         # Prepare evaluation request for math adapter
@@ -64,7 +96,6 @@ class MathEvaluator:
         )
 
         # Store submission
-        payload_content = json.dumps({"steps": steps, "expression": expression})
         submission = SubmissionModel(
             session_id=session_id,
             user_id=user_id,
@@ -78,11 +109,11 @@ class MathEvaluator:
             hidden_total=hidden_results.total,
             categories=hidden_results.categories,
             exec_ms=eval_result.get("exec_ms", 0),
-            payload_sha256=hashlib.sha256(payload_content.encode()).hexdigest(),
+            payload_sha256=payload_sha256,
         )
 
+        # Committed by the caller together with the session and task updates
         self.db.add(submission)
-        await self.db.commit()
 
         return SubmissionResult(
             status="passed" if eval_result["correct"] else "failed",
@@ -96,16 +127,5 @@ class MathEvaluator:
         if eval_result["correct"]:
             return []
 
-        categories = []
         error_type = eval_result.get("error_type")
-
-        if error_type == "wrong_answer":
-            categories.append("incorrect_answer")
-        elif error_type == "incomplete":
-            categories.append("incomplete_solution")
-        elif error_type == "method_error":
-            categories.append("incorrect_method")
-        else:
-            categories.append("unknown_error")
-
-        return categories
+        return [_ERROR_TYPE_CATEGORIES.get(error_type, "unknown_error")]
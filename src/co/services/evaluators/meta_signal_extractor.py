@@ -6,7 +6,169 @@ import ast
 import asyncio
 import re
 import textwrap
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from co.services.evaluators.llm_complexity_analyzer import (
+        HybridComplexityAnalyzer,
+    )
+
+# Problem labels that put a problem on the Meta interview track
+META_TRACK_LABELS = frozenset({"company:meta"})
+
+# JavaScript is scanned with regexes rather than parsed
+_JS_LOOP_RE = re.compile(r"for\s*\(|while\s*\(")
+_JS_FN_RE = re.compile(r"function\s+\w+|=>")
+
+
+# Headroom over the LLM analysis deadline that extract_signals allows for the
+# worker's own event loop and tutor client setup before falling back to
+# AST-only signals
+SYNC_EXTRACT_MARGIN = 0.5
+
+# Runs extract_signals_async for synchronous callers; reused across calls
+_sync_extract_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="meta-signals"
+)
+
+# Upper bound on memoized analyses per helper; repeat grading of the same
+# source (re-scores, retries) hits these instead of re-parsing
+AST_CACHE_MAXSIZE = 2048
+
+
+def _normalize_code(code: str) -> str:
+    """Normalize indentation so trivially reformatted code shares cache entries."""
+
+    return textwrap.dedent(code).strip()
+
+
+class _PythonSignalVisitor(ast.NodeVisitor):
+    """Collect loop depth, definitions, recursion and docstrings in one walk."""
+
+    def __init__(self) -> None:
+        self.max_depth = 0
+        self.current = 0
+        self.function_names: List[str] = []
+        self.enclosing: List[str] = []
+        self.has_recursion = False
+        self.has_docstring = False
+
+    def _visit_documented(self, node: ast.AST) -> None:
+        # Module, class and (nested) function docstrings all count
+        if ast.get_docstring(node):  # type: ignore[arg-type]
+            self.has_docstring = True
+        self.generic_visit(node)
+
+    def _visit_loop(self, node: ast.AST) -> None:
+        self.current += 1
+        self.max_depth = max(self.max_depth, self.current)
+        self.generic_visit(node)
+        self.current -= 1
+
+    def _visit_function(self, node: ast.AST) -> None:
+        self.function_names.append(node.name)  # type: ignore[attr-defined]
+        self.enclosing.append(node.name)  # type: ignore[attr-defined]
+        self._visit_documented(node)
+        self.enclosing.pop()
+
+    visit_For = _visit_loop  # noqa: N815
+    visit_While = _visit_loop  # noqa: N815
+    visit_FunctionDef = _visit_function  # noqa: N815
+    visit_AsyncFunctionDef = _visit_function  # noqa: N815
+    visit_Module = _visit_documented  # noqa: N815
+    visit_ClassDef = _visit_documented  # noqa: N815
+
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        if isinstance(node.func, ast.Name) and node.func.id in self.enclosing:
+            self.has_recursion = True
+        self.generic_visit(node)
+
+
+# The memoized helpers below return shared dicts; callers must copy them.
+@lru_cache(maxsize=AST_CACHE_MAXSIZE)
+def _parse_and_walk_python(code: str) -> Optional[Dict[str, Any]]:
+    """Parse Python source once and collect every AST-derived signal.
+
+    Returns ``None`` when the code does not parse.
+    """
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+
+    visitor = _PythonSignalVisitor()
+    visitor.visit(tree)
+    return {
+        "has_docstring": visitor.has_docstring,
+        "loop_depth": visitor.max_depth,
+        "has_function_defs": bool(visitor.function_names),
+        "function_names": tuple(visitor.function_names),
+        "has_recursion": visitor.has_recursion,
+    }
+
+
+def _python_complexity(code: str) -> Dict[str, Any]:
+    """Very rough Python complexity analysis based on loop depth."""
+
+    walked = _parse_and_walk_python(code)
+    if walked is None:
+        return {"estimated_time": "unknown", "loop_depth": 0}
+
+    depth = walked["loop_depth"]
+    if depth == 0:
+        estimate = "O(1)"
+    elif depth == 1:
+        estimate = "O(n)"
+    else:
+        estimate = f"O(n^{depth})"
+    return {
+        "estimated_time": estimate,
+        "loop_depth": depth,
+        "has_recursion": walked["has_recursion"],
+    }
+
+
+@lru_cache(maxsize=AST_CACHE_MAXSIZE)
+def _javascript_complexity(code: str) -> Dict[str, Any]:
+    """Placeholder complexity analysis for JavaScript."""
+
+    loop_count = len(_JS_LOOP_RE.findall(code))
+    if loop_count == 0:
+        return {"estimated_time": "O(1)", "loop_depth": 0}
+    if loop_count == 1:
+        return {"estimated_time": "O(n)", "loop_depth": 1}
+    return {"estimated_time": f"O(n^{loop_count})", "loop_depth": loop_count}
+
+
+@lru_cache(maxsize=AST_CACHE_MAXSIZE)
+def _quality_signals(code: str, language: str) -> Dict[str, Any]:
+    """Simple code quality metrics."""
+
+    if language == "python":
+        comment_lines = sum(
+            1 for line in code.splitlines() if line.lstrip().startswith("#")
+        )
+        walked = _parse_and_walk_python(code)
+        has_docstring = walked is not None and walked["has_docstring"]
+    else:
+        comment_lines = code.count("//")
+        has_docstring = False
+    return {"comment_lines": comment_lines, "has_docstring": has_docstring}
+
+
+@lru_cache(maxsize=AST_CACHE_MAXSIZE)
+def _structure_signals(code: str, language: str) -> Dict[str, Any]:
+    """Detect structural aspects of the solution."""
+
+    if language == "python":
+        walked = _parse_and_walk_python(code)
+        has_fn = walked is not None and walked["has_function_defs"]
+    else:
+        has_fn = bool(_JS_FN_RE.search(code))
+    return {"has_function_defs": has_fn}
 
 
 class MetaSignalExtractor:
@@ -37,16 +199,21 @@ class MetaSignalExtractor:
         language: str,
         test_results: Dict[str, Any],
         problem_metadata: Dict[str, Any],
+        hybrid_analyzer: Optional[HybridComplexityAnalyzer] = None,
     ) -> Dict[str, Any]:
-        """Async version that can use LLM for complexity analysis."""
+        """Async version that can use LLM for complexity analysis.
+
+        ``hybrid_analyzer`` overrides the extractor's own analyzer for this call.
+        """
 
         # Extract basic complexity signals using AST
         basic_complexity = self._extract_complexity_signals(code, language)
 
         # Use hybrid analyzer if available
-        if self.use_llm and self.hybrid_analyzer:
+        hybrid_analyzer = hybrid_analyzer or self.hybrid_analyzer
+        if self.use_llm and hybrid_analyzer:
             try:
-                complexity = await self.hybrid_analyzer.analyze(
+                complexity = await hybrid_analyzer.analyze(
                     code, language, basic_complexity, problem_metadata
                 )
             except Exception:
@@ -81,17 +248,29 @@ class MetaSignalExtractor:
     ) -> Dict[str, Any]:
         """Synchronous extraction method for backward compatibility."""
 
-        # If LLM is enabled, run async version in event loop
+        # If LLM is enabled, run the async version on its own event loop in a
+        # worker thread, so this also works when called from a running loop
         if self.use_llm:
-            try:
-                return asyncio.run(
-                    self.extract_signals_async(
+            from co.services.evaluators.llm_complexity_analyzer import (
+                ANALYSIS_DEADLINE,
+            )
+
+            # The coroutine is created on the worker, so a job cancelled while
+            # queued leaves no never-awaited coroutine behind
+            future = _sync_extract_executor.submit(
+                lambda: asyncio.run(
+                    self._extract_signals_standalone(
                         code, language, test_results, problem_metadata
                     )
                 )
-            except (RuntimeError, asyncio.TimeoutError, Exception):
-                # Fallback to synchronous version
-                pass
+            )
+            try:
+                return future.result(timeout=ANALYSIS_DEADLINE + SYNC_EXTRACT_MARGIN)
+            except Exception:
+                # Timed out or failed: fall back to synchronous version. A job
+                # still queued behind the single worker is dropped, so later
+                # callers do not wait on extractions nobody will read
+                future.cancel()
 
         # Synchronous fallback
         signals = {
@@ -111,6 +290,27 @@ class MetaSignalExtractor:
             "feedback": feedback,
         }
 
+    async def _extract_signals_standalone(
+        self,
+        code: str,
+        language: str,
+        test_results: Dict[str, Any],
+        problem_metadata: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Run ``extract_signals_async`` on a worker thread's own event loop.
+
+        The loop is discarded afterwards, so the LLM call uses a private tutor
+        connection and none of the application loop's shared state.
+        """
+        from co.services.evaluators.llm_complexity_analyzer import (
+            standalone_hybrid_analyzer,
+        )
+
+        async with standalone_hybrid_analyzer() as hybrid_analyzer:
+            return await self.extract_signals_async(
+                code, language, test_results, problem_metadata, hybrid_analyzer
+            )
+
     # ------------------------------------------------------------------
     # Signal extraction helpers
     # ------------------------------------------------------------------
@@ -145,49 +345,12 @@ class MetaSignalExtractor:
     def _analyze_python_complexity(self, code: str) -> Dict[str, Any]:
         """Very rough Python complexity analysis based on loop depth."""
 
-        try:
-            tree = ast.parse(textwrap.dedent(code))
-        except SyntaxError:
-            return {"estimated_time": "unknown", "loop_depth": 0}
-
-        class LoopDepthVisitor(ast.NodeVisitor):
-            def __init__(self) -> None:
-                self.max_depth = 0
-                self.current = 0
-
-            def generic_visit(self, node):
-                super().generic_visit(node)
-
-            def visit_For(self, node):  # type: ignore[override]  # noqa: N802
-                self.current += 1
-                self.max_depth = max(self.max_depth, self.current)
-                self.generic_visit(node)
-                self.current -= 1
-
-            def visit_While(self, node):  # type: ignore[override]  # noqa: N802
-                self.visit_For(node)
-
-        visitor = LoopDepthVisitor()
-        visitor.visit(tree)
-        depth = visitor.max_depth
-
-        if depth == 0:
-            estimate = "O(1)"
-        elif depth == 1:
-            estimate = "O(n)"
-        else:
-            estimate = f"O(n^{depth})"
-        return {"estimated_time": estimate, "loop_depth": depth}
+        return _python_complexity(_normalize_code(code))
 
     def _analyze_javascript_complexity(self, code: str) -> Dict[str, Any]:
         """Placeholder complexity analysis for JavaScript."""
 
-        loop_count = len(re.findall(r"for\s*\(|while\s*\(", code))
-        if loop_count == 0:
-            return {"estimated_time": "O(1)", "loop_depth": 0}
-        if loop_count == 1:
-            return {"estimated_time": "O(n)", "loop_depth": 1}
-        return {"estimated_time": f"O(n^{loop_count})", "loop_depth": loop_count}
+        return dict(_javascript_complexity(_normalize_code(code)))
 
     # ------------------------------------------------------------------
     # Additional signal extraction helpers
@@ -195,13 +358,7 @@ class MetaSignalExtractor:
     def _extract_quality_signals(self, code: str, language: str) -> Dict[str, Any]:
         """Simple code quality metrics."""
 
-        if language == "python":
-            comment_lines = len(re.findall(r"^\s*#", code, re.MULTILINE))
-            has_docstring = bool(re.search(r'"""|\'\'\'', code))
-        else:
-            comment_lines = len(re.findall(r"//", code))
-            has_docstring = False
-        return {"comment_lines": comment_lines, "has_docstring": has_docstring}
+        return dict(_quality_signals(_normalize_code(code), language))
 
     def _extract_test_signals(self, code: str, language: str) -> Dict[str, Any]:
         """Detect testing related signals in submission code."""
@@ -215,15 +372,7 @@ class MetaSignalExtractor:
     def _extract_structure_signals(self, code: str, language: str) -> Dict[str, Any]:
         """Detect structural aspects of the solution."""
 
-        if language == "python":
-            try:
-                tree = ast.parse(code)
-            except SyntaxError:
-                return {"has_function_defs": False}
-            has_fn = any(isinstance(n, ast.FunctionDef) for n in ast.walk(tree))
-        else:
-            has_fn = bool(re.search(r"function\s+\w+|=>", code))
-        return {"has_function_defs": has_fn}
+        return dict(_structure_signals(_normalize_code(code), language))
 
     # ------------------------------------------------------------------
     # Scoring and feedback
@@ -337,7 +486,8 @@ class MetaSignalExtractor:
     def _check_edge_case_handling(self, test_results: Dict[str, Any]) -> bool:
         return "edge_cases" not in test_results.get("categories", [])
 
-    def _is_meta_track(self, metadata: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _is_meta_track(metadata: Dict[str, Any]) -> bool:
         """Check if a problem belongs to the Meta interview track."""
 
-        return "company:meta" in metadata.get("labels", [])
+        return not META_TRACK_LABELS.isdisjoint(metadata.get("labels", ()))
@@ -112,8 +112,10 @@ class PersonalizationService:
         # Check submission history
         from co.db.models import Submission
 
+        # Only created_at is read so idx_submissions_user_problem_recent can
+        # answer this with an index-only scan
         result = await self.db.execute(
-            select(Submission)
+            select(Submission.created_at)
             .where(
                 Submission.user_id == user_id,
                 Submission.problem_id == problem_id,
@@ -121,13 +123,13 @@ class PersonalizationService:
             .order_by(Submission.created_at.desc())
             .limit(1)
         )
-        last_submission = result.scalar_one_or_none()
+        last_attempt_at = result.scalar_one_or_none()
 
-        if not last_submission:
+        if not last_attempt_at:
             return 1.0  # Never attempted
 
         # Score based on time since last attempt
-        days_since = (datetime.utcnow() - last_submission.created_at).days
+        days_since = (datetime.utcnow() - last_attempt_at).days
         if days_since > 30:
             return 1.0
         elif days_since > 7:
@@ -211,7 +213,7 @@ class PersonalizationService:
         problem_id: str,
         success: bool,
     ) -> None:
-        """Update mastery scores based on submission result."""
+        """Update mastery scores based on submission result. The caller commits."""
         # Get problem topics
         problem_data = await self.problem_bank.get_problem(problem_id)
         topics = problem_data.get("topics", [])
@@ -245,15 +247,13 @@ class PersonalizationService:
             m.score = int(m.ema * 100)
             m.updated_at = datetime.utcnow()
 
-        await self.db.commit()
-
     async def add_to_review_queue(
         self,
         user_id: UUID,
         problem_id: str,
         reason: str,
     ) -> None:
-        """Add problem to spaced review queue."""
+        """Add problem to spaced review queue. The caller commits."""
         # Check if already in queue
         result = await self.db.execute(
             select(ReviewQueue).where(
@@ -282,12 +282,10 @@ class PersonalizationService:
             )
             self.db.add(review)
 
-        await self.db.commit()
-
     async def mark_review_result(
         self, user_id: UUID, problem_id: str, success: bool
     ) -> None:
-        """Update review queue entry based on task result."""
+        """Update review queue entry based on task result. The caller commits."""
         result = await self.db.execute(
             select(ReviewQueue).where(
                 ReviewQueue.user_id == user_id,
@@ -313,5 +311,3 @@ class PersonalizationService:
             i.bucket = 0
             days = self.settings.review_buckets[0]
             i.next_due_at = datetime.utcnow() + timedelta(days=days)
-
-        await self.db.commit()
@@ -6,9 +6,13 @@ from uuid import UUID
 
 from co.db.models import Session as SessionModel
 from co.services.personalization import PersonalizationService
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Built once; only the bound session id varies per request
+_SESSION_BY_ID = select(SessionModel).where(SessionModel.id == bindparam("session_id"))
+_SESSION_FOR_USER = _SESSION_BY_ID.where(SessionModel.user_id == bindparam("user_id"))
+
 
 class SessionService:
     """Service for managing learning sessions."""
@@ -52,8 +56,15 @@ class SessionService:
 
     async def get_session(self, session_id: UUID) -> Optional[SessionModel]:
         """Get session by ID."""
+        result = await self.db.execute(_SESSION_BY_ID, {"session_id": session_id})
+        return result.scalar_one_or_none()
+
+    async def get_session_for_user(
+        self, session_id: UUID, user_id: UUID
+    ) -> Optional[SessionModel]:
+        """Get session by ID if it belongs to the user."""
         result = await self.db.execute(
-            select(SessionModel).where(SessionModel.id == session_id)
+            _SESSION_FOR_USER, {"session_id": session_id, "user_id": user_id}
         )
         return result.scalar_one_or_none()
 
@@ -121,7 +132,7 @@ class SessionService:
         await self.db.commit()
 
     async def record_success(self, session_id: UUID) -> None:
-        """Record successful submission."""
+        """Record successful submission. The caller commits."""
         # Update mastery scores
         session = await self.get_session(session_id)
         if session:
@@ -137,7 +148,7 @@ class SessionService:
             )
 
     async def record_failure(self, session_id: UUID, categories: List[str]) -> None:
-        """Record failed submission with failure categories."""
+        """Record failed submission with failure categories. The caller commits."""
         session = await self.get_session(session_id)
         if session:
             # Update mastery
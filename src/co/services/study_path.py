@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any, Optional, cast
 from uuid import UUID
 
+from co.clients.redis import get_redis
 from co.config import get_settings
 from co.models import StudyPath
 from redis import asyncio as aioredis
@@ -24,7 +25,7 @@ class StudyPathService:
 
     async def _get_redis(self) -> aioredis.Redis:
         if not self._redis:
-            self._redis = await aioredis.from_url(self.settings.redis_url)
+            self._redis = await get_redis()
         return self._redis
 
     def _cache_key(self, user_id: str) -> str:
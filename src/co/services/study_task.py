@@ -15,9 +15,21 @@ from co.models import (
 from co.schemas.study_tasks import StudyTaskCreate
 from co.schemas.submissions import SubmissionResult
 from co.services.personalization import PersonalizationService
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Built once; only the bound user id varies per request
+_NEXT_SCHEDULED_TASK = (
+    select(StudyTask)
+    .join(StudyPath)
+    .where(
+        StudyPath.user_id == bindparam("user_id"),
+        StudyTask.status == TaskStatus.scheduled,
+    )
+    .order_by(StudyTask.scheduled_at)
+    .limit(1)
+)
+
 
 class StudyTaskService:
     """Operations related to study tasks."""
@@ -33,40 +45,42 @@ class StudyTaskService:
         path = await self.db.get(StudyPath, path_id)
         if not path or path.user_id != str(user_id):
             raise ValueError("Study path not found")
-
-        created: list[StudyTask] = []
-        for data in tasks:
-            task = StudyTask(
-                path_id=path_id,
-                problem_id=data.problem_id,
-                module=data.module,
-                topic_tags=data.topic_tags,
-                difficulty=data.difficulty,
-                scheduled_at=data.scheduled_at,
-                meta=data.meta,
-            )
-            self.db.add(task)
-            event = TaskEvent(task=task, event_type=TaskEventType.created, payload={})
-            self.db.add(event)
-            created.append(task)
+        # An empty parameter list would execute as a single-row INSERT
+        if not tasks:
+            return []
+
+        # One multi-row INSERT ... RETURNING per table instead of a flush per
+        # object plus a refresh SELECT per task
+        result = await self.db.scalars(
+            insert(StudyTask).returning(StudyTask, sort_by_parameter_order=True),
+            [
+                {
+                    "path_id": path_id,
+                    "problem_id": data.problem_id,
+                    "module": data.module,
+                    "topic_tags": data.topic_tags,
+                    "difficulty": data.difficulty,
+                    "scheduled_at": data.scheduled_at,
+                    "meta": data.meta,
+                }
+                for data in tasks
+            ],
+        )
+        created = list(result.all())
+        await self.db.execute(
+            insert(TaskEvent),
+            [
+                {"task_id": task.id, "event_type": TaskEventType.created, "payload": {}}
+                for task in created
+            ],
+        )
 
         await self.db.commit()
-        for task in created:
-            await self.db.refresh(task)
         return created
 
     async def get_next_task(self, user_id: UUID) -> StudyTask | None:
         """Get the next scheduled study task for a user."""
-        result = await self.db.execute(
-            select(StudyTask)
-            .join(StudyPath)
-            .where(
-                StudyPath.user_id == str(user_id),
-                StudyTask.status == TaskStatus.scheduled,
-            )
-            .order_by(StudyTask.scheduled_at)
-            .limit(1)
-        )
+        result = await self.db.execute(_NEXT_SCHEDULED_TASK, {"user_id": str(user_id)})
         return result.scalar_one_or_none()
 
     async def get_user_tasks(
@@ -100,7 +114,10 @@ class StudyTaskService:
         code: str | None,
         result: SubmissionResult,
     ) -> TaskEvaluation:
-        """Record evaluation result for a study task."""
+        """Record evaluation result for a study task.
+
+        Changes are flushed, not committed; the caller commits.
+        """
         task = await self.db.get(StudyTask, task_id)
         if not task:
             raise ValueError("Task not found")
@@ -142,7 +159,7 @@ class StudyTaskService:
             success=result.status == "passed",
         )
 
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(evaluation)
         await self.db.refresh(task)
         return evaluation
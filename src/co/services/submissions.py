@@ -0,0 +1,173 @@
+"""Submission lookup service."""
+
+import hashlib
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+import orjson
+from co.db.models import Submission as SubmissionModel
+from co.schemas.submissions import HiddenResults, SubmissionResult, VisibleResults
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_SUBMISSION_FOR_USER = select(SubmissionModel).where(
+    SubmissionModel.id == bindparam("submission_id"),
+    SubmissionModel.user_id == bindparam("user_id"),
+)
+# Only graded outcomes are replayed; a timeout or error is evaluated again
+_REPLAYABLE_STATUSES = ("passed", "failed")
+# Served by idx_submissions_session_payload
+_PREVIOUS_ATTEMPT = (
+    select(SubmissionModel)
+    .where(
+        SubmissionModel.session_id == bindparam("session_id"),
+        SubmissionModel.payload_sha256 == bindparam("payload_sha256"),
+        SubmissionModel.problem_id == bindparam("problem_id"),
+        SubmissionModel.status.in_(_REPLAYABLE_STATUSES),
+    )
+    .order_by(SubmissionModel.created_at.desc())
+    .limit(1)
+)
+# Served by idx_submissions_user_problem_recent; the time window keeps the
+# payload filter to the user's last few attempts at the problem
+_RECENT_USER_ATTEMPT = (
+    select(SubmissionModel)
+    .where(
+        SubmissionModel.user_id == bindparam("user_id"),
+        SubmissionModel.problem_id == bindparam("problem_id"),
+        SubmissionModel.payload_sha256 == bindparam("payload_sha256"),
+        SubmissionModel.created_at >= bindparam("since"),
+        SubmissionModel.status.in_(_REPLAYABLE_STATUSES),
+    )
+    .order_by(SubmissionModel.created_at.desc())
+    .limit(1)
+)
+
+
+def coding_payload_digest(language: str, code: str) -> bytes:
+    """SHA-256 digest of a coding submission payload.
+
+    The language is part of the digest, so the same source submitted under
+    another language is graded on its own.
+    """
+    return hashlib.sha256(f"{language}\0{code}".encode()).digest()
+
+
+def math_payload_digest(steps: Optional[List[str]], expression: Optional[str]) -> bytes:
+    """SHA-256 digest of a math submission payload.
+
+    Keys are sorted so the digest does not depend on field order.
+    """
+    payload_bytes = orjson.dumps(
+        {"steps": steps, "expression": expression}, option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.sha256(payload_bytes).digest()
+
+
+class SubmissionService:
+    """Service for reading stored submissions."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_submission_for_user(
+        self, submission_id: UUID, user_id: UUID
+    ) -> Optional[SubmissionModel]:
+        """Get a submission by ID if it belongs to the user."""
+        result = await self.db.execute(
+            _SUBMISSION_FOR_USER,
+            {"submission_id": submission_id, "user_id": user_id},
+        )
+        return result.scalar_one_or_none()
+
+    async def find_previous_attempt(
+        self, session_id: UUID, problem_id: str, payload_sha256: bytes
+    ) -> Optional[SubmissionModel]:
+        """Find an already evaluated, identical attempt in the same session."""
+        result = await self.db.execute(
+            _PREVIOUS_ATTEMPT,
+            {
+                "session_id": session_id,
+                "problem_id": problem_id,
+                "payload_sha256": payload_sha256,
+            },
+        )
+        return result.scalar_one_or_none()
+
+    async def find_recent_attempt(
+        self,
+        user_id: UUID,
+        problem_id: str,
+        payload_sha256: bytes,
+        since: datetime,
+    ) -> Optional[SubmissionModel]:
+        """Find the user's latest identical attempt made at or after ``since``.
+
+        Unlike ``find_previous_attempt`` this spans all of the user's sessions.
+        """
+        result = await self.db.execute(
+            _RECENT_USER_ATTEMPT,
+            {
+                "user_id": user_id,
+                "problem_id": problem_id,
+                "payload_sha256": payload_sha256,
+                "since": since,
+            },
+        )
+        return result.scalar_one_or_none()
+
+    def record_replay(
+        self,
+        previous: SubmissionModel,
+        session_id: UUID,
+        payload_sha256: bytes,
+    ) -> SubmissionResult:
+        """Record ``previous``'s grade as a new attempt in ``session_id``.
+
+        The copied row is committed by the caller together with the session
+        and task updates.
+        """
+        self.db.add(
+            SubmissionModel(
+                session_id=session_id,
+                user_id=previous.user_id,
+                problem_id=previous.problem_id,
+                subject=previous.subject,
+                language=previous.language,
+                status=previous.status,
+                visible_passed=previous.visible_passed,
+                visible_total=previous.visible_total,
+                hidden_passed=previous.hidden_passed,
+                hidden_total=previous.hidden_total,
+                categories=previous.categories,
+                exec_ms=previous.exec_ms,
+                pillar_scores=previous.pillar_scores,
+                signal_metadata=previous.signal_metadata,
+                feedback=previous.feedback,
+                payload_sha256=payload_sha256,
+            )
+        )
+        return self.to_result(previous)
+
+    @staticmethod
+    def to_result(submission: SubmissionModel) -> SubmissionResult:
+        """Rebuild the evaluation result from a stored submission.
+
+        Per-test ``visible.details`` are not persisted and come back empty.
+        """
+        return SubmissionResult(
+            status=submission.status,
+            visible=VisibleResults(
+                passed=submission.visible_passed,
+                total=submission.visible_total,
+            ),
+            hidden=HiddenResults(
+                passed=submission.hidden_passed,
+                total=submission.hidden_total,
+                categories=submission.categories or [],
+            ),
+            exec_ms=submission.exec_ms,
+            pillar_scores=submission.pillar_scores,
+            feedback=submission.feedback,
+        )
@@ -3,10 +3,54 @@
 from typing import List, Optional
 from uuid import UUID
 
+from co.clients.redis import get_redis
 from co.db.models import Track as TrackModel
-from sqlalchemy import select
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Fixed-shape lookups built once; only the bound values vary per request
+_TRACK_BY_ID = select(TrackModel).where(TrackModel.id == bindparam("track_id"))
+_TRACK_BY_SLUG = select(TrackModel).where(TrackModel.slug == bindparam("slug"))
+
+# Rendered track responses are cached briefly; writes bust them explicitly
+TRACK_RESPONSE_CACHE_TTL = 60
+_TRACK_CACHE_PREFIX = "tracks:resp:"
+
+
+def track_list_cache_key(subject: Optional[str], label: Optional[str]) -> str:
+    return f"{_TRACK_CACHE_PREFIX}list:{subject or ''}:{label or ''}:v1"
+
+
+def track_cache_key(track_id: str) -> str:
+    return f"{_TRACK_CACHE_PREFIX}one:{track_id}:v1"
+
+
+async def get_cached_response(key: str) -> Optional[bytes]:
+    """Return a cached rendered response body, or None on a miss or Redis error."""
+    try:
+        redis = await get_redis()
+        return await redis.get(key)
+    except RedisError:
+        return None
+
+
+async def cache_response(key: str, body: bytes) -> None:
+    """Cache a rendered response body; Redis errors only cost the cache write."""
+    try:
+        redis = await get_redis()
+        await redis.setex(key, TRACK_RESPONSE_CACHE_TTL, body)
+    except RedisError:
+        pass
+
+
+async def cache_bust_tracks() -> None:
+    """Drop every cached track response after tracks are written."""
+    redis = await get_redis()
+    keys = [key async for key in redis.scan_iter(match=f"{_TRACK_CACHE_PREFIX}*")]
+    if keys:
+        await redis.delete(*keys)
+
 
 class TrackService:
     """Service for managing tracks and curricula."""
@@ -26,7 +70,8 @@ class TrackService:
             query = query.where(TrackModel.subject == subject)
 
         if label:
-            # Use JSONB contains for label filtering
+            # Use JSONB containment (@>) so idx_tracks_labels (jsonb_path_ops)
+            # can serve the filter
             query = query.where(TrackModel.labels.contains([label]))
 
         result = await self.db.execute(query)
@@ -34,14 +79,10 @@ class TrackService:
 
     async def get_track_by_id(self, track_id: UUID) -> Optional[TrackModel]:
         """Get track by ID."""
-        result = await self.db.execute(
-            select(TrackModel).where(TrackModel.id == track_id)
-        )
+        result = await self.db.execute(_TRACK_BY_ID, {"track_id": track_id})
         return result.scalar_one_or_none()
 
     async def get_track_by_slug(self, slug: str) -> Optional[TrackModel]:
         """Get track by slug."""
-        result = await self.db.execute(
-            select(TrackModel).where(TrackModel.slug == slug)
-        )
+        result = await self.db.execute(_TRACK_BY_SLUG, {"slug": slug})
         return result.scalar_one_or_none()
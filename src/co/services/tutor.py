@@ -1,14 +1,16 @@
 """Tutor orchestration service."""
 
 from typing import Any, Dict, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from co.clients.problem_bank import ProblemBankClient
+from co.clients.redis import get_redis
 from co.clients.tutor_api import TutorAPIClient
 from co.config import get_settings
-from redis import asyncio as aioredis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+STREAM_TTL_SECONDS = 300
+
 
 class TutorService:
     """Service for orchestrating tutor interactions."""
@@ -23,7 +25,7 @@ class TutorService:
     async def _get_redis(self):
         """Get Redis connection."""
         if not self._redis:
-            self._redis = await aioredis.from_url(self.settings.redis_url)
+            self._redis = await get_redis()
         return self._redis
 
     async def count_active_streams(self, user_id: UUID) -> int:
@@ -40,8 +42,58 @@ class TutorService:
         hint_level: int,
         last_eval: Optional[Dict[str, Any]],
         user_id: UUID,
-    ) -> Dict[str, str]:
-        """Create a new tutor turn and return stream info."""
+    ) -> Optional[Dict[str, str]]:
+        """Create a new tutor turn and return stream info.
+
+        Returns None, without starting a turn upstream, if the user already
+        has ``max_concurrent_sse`` streams open.
+        """
+        # Reserve a stream slot first, adding the reservation and reading back
+        # the count in one MULTI, so two concurrent turns cannot both slip
+        # under the limit and no upstream turn is started for a rejected one
+        redis = await self._get_redis()
+        stream_key = f"sse:streams:{user_id}"
+        reservation = f"pending:{uuid4()}"
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(stream_key, reservation)
+            pipe.expire(stream_key, STREAM_TTL_SECONDS)
+            pipe.scard(stream_key)
+            _, _, active = await pipe.execute()
+
+        if active > self.settings.max_concurrent_sse:
+            await redis.srem(stream_key, reservation)
+            return None
+
+        try:
+            response = await self._start_turn(
+                session_id, problem_id, hint_level, last_eval, user_id
+            )
+        except BaseException:
+            # Includes cancellation; the slot must not stay held until the TTL
+            await redis.srem(stream_key, reservation)
+            raise
+
+        # Swap the reservation for the stream token cleanup_stream removes
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.srem(stream_key, reservation)
+            pipe.sadd(stream_key, response["token"])
+            pipe.expire(stream_key, STREAM_TTL_SECONDS)
+            await pipe.execute()
+
+        return {
+            "stream_url": f"{self.settings.api_base}/v1/tutor/stream",
+            "token": response["token"],
+        }
+
+    async def _start_turn(
+        self,
+        session_id: UUID,
+        problem_id: str,
+        hint_level: int,
+        last_eval: Optional[Dict[str, Any]],
+        user_id: UUID,
+    ) -> Dict[str, Any]:
+        """Build the tutor request for the problem and start the turn upstream."""
         # Fetch problem content
         problem = await self.problem_bank.get_problem(problem_id)
 
@@ -71,18 +123,7 @@ class TutorService:
         }
 
         # Initialize tutor turn
-        response = await self.tutor_client.create_turn(tutor_request)
-
-        # Register stream in Redis
-        redis = await self._get_redis()
-        stream_key = f"sse:streams:{user_id}"
-        await redis.sadd(stream_key, response["token"])
-        await redis.expire(stream_key, 300)  # 5 minute TTL
-
-        return {
-            "stream_url": f"{self.settings.api_base}/v1/tutor/stream",
-            "token": response["token"],
-        }
+        return await self.tutor_client.create_turn(tutor_request)
 
     async def cleanup_stream(self, user_id: UUID, token: str) -> None:
         """Clean up completed stream."""
@@ -29,6 +29,58 @@ class TestTracksAPI:
         response = auth_client.get("/v1/tracks?label=company:meta")
         assert response.status_code == 200
 
+    def test_list_tracks_etag(self, auth_client: TestClient):
+        """A matching If-None-Match gets 304 without a body."""
+        response = auth_client.get("/v1/tracks")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = auth_client.get("/v1/tracks", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+        response = auth_client.get("/v1/tracks", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+
+    def test_list_tracks_served_from_cache(self, auth_client: TestClient, monkeypatch):
+        """A cached list response is served without querying the database."""
+        from co.services import tracks as track_service
+
+        store = {}
+
+        class FakeRedis:
+            async def get(self, key):
+                return store.get(key)
+
+            async def setex(self, key, ttl, value):
+                store[key] = value
+
+        async def get_redis():
+            return FakeRedis()
+
+        monkeypatch.setattr(track_service, "get_redis", get_redis)
+
+        first = auth_client.get("/v1/tracks?subject=math")
+        assert first.status_code == 200
+        assert list(store) == [track_service.track_list_cache_key("math", None)]
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("database queried on a cache hit")
+
+        monkeypatch.setattr(track_service.TrackService, "list_tracks", fail)
+        second = auth_client.get("/v1/tracks?subject=math")
+        assert second.status_code == 200
+        assert second.content == first.content
+
+    def test_get_track_unknown_id_and_slug(self, auth_client: TestClient):
+        """Both UUID and slug lookups return 404 for unknown tracks."""
+        response = auth_client.get("/v1/tracks/550e8400-e29b-41d4-a716-446655440000")
+        assert response.status_code == 404
+
+        response = auth_client.get("/v1/tracks/no-such-track")
+        assert response.status_code == 404
+
 
 class TestSessionsAPI:
     """Test the sessions API endpoints."""
@@ -73,6 +125,125 @@ class TestSubmissionsAPI:
             # Note: This might return 409 if Problem Bank is not available
             assert response.status_code in [200, 201, 409, 422, 500]
 
+    def test_identical_resubmission_replays_result(
+        self, auth_client: TestClient, mock_eval_service_client
+    ):
+        """An identical payload in the same session is not evaluated again."""
+        session_response = auth_client.post(
+            "/v1/sessions", json={"subject": "coding", "mode": "practice"}
+        )
+        assert session_response.status_code in [200, 201]
+
+        submission_data = {
+            "session_id": session_response.json()["id"],
+            "problem_id": "two-sum-variant",
+            "subject": "coding",
+            "payload": {
+                "language": "python",
+                "code": "def two_sum(nums, target):\n    return [1, 0]",
+            },
+        }
+
+        first = auth_client.post("/v1/submissions", json=submission_data)
+        second = auth_client.post("/v1/submissions", json=submission_data)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json()["status"] == first.json()["status"]
+        assert second.json()["hidden"] == first.json()["hidden"]
+        assert mock_eval_service_client.evaluate_code.await_count == 1
+
+    def test_resubmission_replay_limits(
+        self, auth_client: TestClient, mock_eval_service_client
+    ):
+        """Other languages, errored runs and task updates are not short-circuited."""
+        session_response = auth_client.post(
+            "/v1/sessions", json={"subject": "coding", "mode": "practice"}
+        )
+        assert session_response.status_code in [200, 201]
+
+        code = "def two_sum(nums, target):\n    return [2, 0]"
+        submission_data = {
+            "session_id": session_response.json()["id"],
+            "problem_id": "two-sum-variant",
+            "subject": "coding",
+            "payload": {"language": "python", "code": code},
+        }
+        assert auth_client.post("/v1/submissions", json=submission_data).is_success
+
+        # The same source under another language is graded on its own
+        submission_data["payload"] = {"language": "javascript", "code": code}
+        mock_eval_service_client.evaluate_code.return_value = {
+            "status": "error",
+            "visible": {"passed": 0, "total": 2},
+            "hidden": {"passed": 0, "total": 5, "categories": []},
+            "exec_ms": 0,
+        }
+        assert auth_client.post("/v1/submissions", json=submission_data).is_success
+        assert mock_eval_service_client.evaluate_code.await_count == 2
+
+        # An errored run is evaluated again rather than replayed
+        assert auth_client.post("/v1/submissions", json=submission_data).is_success
+        assert mock_eval_service_client.evaluate_code.await_count == 3
+
+        # A replayed grade is still recorded against the study task
+        submission_data["payload"] = {"language": "python", "code": code}
+        submission_data["task_id"] = "550e8400-e29b-41d4-a716-446655440000"
+        response = auth_client.post("/v1/submissions", json=submission_data)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Study task not found"
+        assert mock_eval_service_client.evaluate_code.await_count == 3
+
+    def test_recent_math_answer_replays_across_sessions(
+        self,
+        auth_client: TestClient,
+        mock_eval_service_client,
+        mock_problem_bank_client,
+    ):
+        """The same math answer in a new session reuses the recent grade."""
+        mock_eval_service_client.evaluate_math.return_value = {
+            "correct": True,
+            "feedback": "Correct",
+            "exec_ms": 15,
+        }
+        payload = {"steps": ["2x = 8", "x = 4"], "expression": "x = 4"}
+
+        responses = []
+        for _ in range(2):
+            session_response = auth_client.post(
+                "/v1/sessions", json={"subject": "math", "mode": "practice"}
+            )
+            assert session_response.status_code in [200, 201]
+            responses.append(
+                auth_client.post(
+                    "/v1/submissions",
+                    json={
+                        "session_id": session_response.json()["id"],
+                        "problem_id": "linear-eq-replay",
+                        "subject": "math",
+                        "payload": payload,
+                    },
+                )
+            )
+
+        assert [response.status_code for response in responses] == [200, 200]
+        assert responses[1].json()["status"] == "passed"
+        assert responses[1].json()["exec_ms"] == 15
+        assert mock_eval_service_client.evaluate_math.await_count == 1
+        problem_fetches = [
+            call
+            for call in mock_problem_bank_client.get_problem.await_args_list
+            if call.args == ("linear-eq-replay",)
+        ]
+        assert len(problem_fetches) == 1
+
+    def test_get_unknown_submission(self, auth_client: TestClient):
+        """Fetching a submission that does not exist returns 404."""
+        response = auth_client.get(
+            "/v1/submissions/550e8400-e29b-41d4-a716-446655440099"
+        )
+        assert response.status_code == 404
+
 
 class TestTutorAPI:
     """Test the tutor API endpoints."""
@@ -1,5 +1,7 @@
+import jwt
 import pytest
-from co.auth import get_current_user
+from co import auth
+from co.auth import decode_token, get_current_user, parse_uuid
 from co.middleware import AuthMiddleware
 from fastapi import Depends, FastAPI, Request
 from fastapi.testclient import TestClient
@@ -14,6 +16,10 @@ def auth_app():
     async def read_state(request: Request):
         return {"user_id": getattr(request.state, "user_id", None)}
 
+    @app.get("/health")
+    async def health(request: Request):
+        return {"user_id": getattr(request.state, "user_id", None)}
+
     @app.get("/me")
     async def read_me(user_id=Depends(get_current_user)):
         return {"user_id": str(user_id)}
@@ -40,3 +46,60 @@ def test_auth_middleware_invalid_token(auth_app):
     response = client.get("/state", headers={"Authorization": "Bearer invalid"})
     assert response.status_code == 401
     assert "detail" in response.json()
+
+
+def test_decode_token_caches_verified_payload(
+    monkeypatch, test_jwt_token, test_user_id
+):
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth, "_token_cache", auth.OrderedDict())
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+
+    assert decode_token(test_jwt_token)["sub"] == test_user_id
+    assert decode_token(test_jwt_token)["sub"] == test_user_id
+    assert len(calls) == 1
+
+
+def test_parse_uuid(test_user_id):
+    parsed = parse_uuid(test_user_id)
+    assert str(parsed) == test_user_id
+    assert parse_uuid(parsed) is parsed
+    for form in (parsed.hex, f"{{{test_user_id}}}", parsed.urn):
+        assert parse_uuid(form) == parsed
+    assert parse_uuid(f"{{{test_user_id}") is None
+    assert parse_uuid("not-a-uuid") is None
+    assert parse_uuid(None) is None
+
+
+def test_auth_middleware_reuses_cached_token(
+    monkeypatch, auth_app, test_jwt_token, test_user_id
+):
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth, "_token_cache", auth.OrderedDict())
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+
+    client = TestClient(auth_app)
+    headers = {"Authorization": f"Bearer {test_jwt_token}"}
+    for _ in range(3):
+        response = client.get("/state", headers=headers)
+        assert response.json()["user_id"] == test_user_id
+    assert len(calls) == 1
+
+
+def test_auth_middleware_skips_public_paths(auth_app):
+    client = TestClient(auth_app)
+    response = client.get("/health", headers={"Authorization": "Bearer invalid"})
+    assert response.status_code == 200
+    assert response.json()["user_id"] is None
@@ -0,0 +1,47 @@
+import httpx
+import orjson
+import pytest
+from co.clients import tutor_api
+from co.clients.http import close_http_clients, get_http_client
+from co.clients.tutor_api import TutorAPIClient
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared_per_base_url():
+    timeout = httpx.Timeout(5.0)
+    headers = {"X-Service": "curriculum-orchestrator"}
+
+    first = get_http_client("http://svc-a", timeout, headers)
+    assert get_http_client("http://svc-a", timeout, headers) is first
+    assert get_http_client("http://svc-b", timeout, headers) is not first
+
+    await close_http_clients()
+    assert first.is_closed
+    assert get_http_client("http://svc-a", timeout, headers) is not first
+    await close_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_analyze_code_retries_server_errors_only(monkeypatch):
+    monkeypatch.setattr(tutor_api, "ANALYZE_RETRY_BACKOFF", 0)
+    statuses = [503, 200, 400]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(statuses.pop(0), json={"content": "{}"})
+
+    client = httpx.AsyncClient(
+        base_url="http://tutor", transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(TutorAPIClient, "_client", client)
+    tutor = TutorAPIClient()
+
+    assert await tutor.analyze_code("prompt", max_retries=2) == "{}"
+    assert len(requests) == 2
+    assert orjson.loads(requests[0].content)["prompt"] == "prompt"
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await tutor.analyze_code("prompt", max_retries=2)
+    assert len(requests) == 3
+    await client.aclose()
@@ -0,0 +1,122 @@
+import asyncio
+from collections import OrderedDict
+from unittest.mock import AsyncMock
+
+import pytest
+from co.services.evaluators import llm_complexity_analyzer
+from co.services.evaluators.llm_complexity_analyzer import LLMComplexityAnalyzer
+
+LLM_RESPONSE = (
+    '{"time_complexity": "O(n)", "space_complexity": "O(n)", "confidence": 90}'
+)
+
+
+@pytest.mark.asyncio
+async def test_repeat_analysis_is_served_from_cache(monkeypatch):
+    monkeypatch.setattr(llm_complexity_analyzer, "_analysis_cache", OrderedDict())
+    analyzer = LLMComplexityAnalyzer()
+    analyzer.tutor_client = AsyncMock()
+    analyzer.tutor_client.analyze_code.return_value = LLM_RESPONSE
+
+    code = "def f(nums):\n    return sorted(nums)\n"
+    first = await analyzer.analyze_complexity(code, "python", "Sort the input")
+    second = await analyzer.analyze_complexity(code, "python", "Sort the input")
+
+    assert first == second
+    assert first["time_complexity"] == "O(n)"
+    analyzer.tutor_client.analyze_code.assert_awaited_once()
+
+    # A different problem context is a different analysis
+    await analyzer.analyze_complexity(code, "python", "Reverse the input")
+    assert analyzer.tutor_client.analyze_code.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_analysis_is_not_cached(monkeypatch):
+    monkeypatch.setattr(llm_complexity_analyzer, "_analysis_cache", OrderedDict())
+    analyzer = LLMComplexityAnalyzer()
+    analyzer.tutor_client = AsyncMock()
+    analyzer.tutor_client.analyze_code.side_effect = [
+        RuntimeError("tutor unavailable"),
+        LLM_RESPONSE,
+    ]
+
+    failed = await analyzer.analyze_complexity("x = 1", "python")
+    assert failed["confidence"] == 0
+
+    retried = await analyzer.analyze_complexity("x = 1", "python")
+    assert retried["confidence"] == 90
+
+
+@pytest.mark.asyncio
+async def test_concurrent_analyses_share_one_batch_request(monkeypatch):
+    monkeypatch.setattr(llm_complexity_analyzer, "_analysis_cache", OrderedDict())
+    client = AsyncMock()
+    client.analyze_code_batch.side_effect = lambda prompts, **_: [
+        LLM_RESPONSE for _ in prompts
+    ]
+    analyzers = [LLMComplexityAnalyzer() for _ in range(3)]
+    for analyzer in analyzers:
+        analyzer.tutor_client = client
+
+    results = await asyncio.gather(
+        analyzers[0].analyze_complexity("a = 1", "python"),
+        analyzers[1].analyze_complexity("b = 2", "python"),
+        # Identical to the first submission; shares its prompt in the batch
+        analyzers[2].analyze_complexity("a = 1", "python"),
+    )
+
+    assert [result["confidence"] for result in results] == [90, 90, 90]
+    client.analyze_code.assert_not_awaited()
+    client.analyze_code_batch.assert_awaited_once()
+    assert len(client.analyze_code_batch.await_args.kwargs["prompts"]) == 2
+
+
+def test_parse_llm_response_handles_json_and_free_text():
+    analyzer = LLMComplexityAnalyzer()
+
+    parsed = analyzer._parse_llm_response(LLM_RESPONSE)
+    assert parsed["time_complexity"] == "O(n)"
+    assert parsed["confidence"] == 90
+
+    fallback = analyzer._parse_llm_response("Sorting dominates: O(n log n).")
+    assert fallback["time_complexity"] == "O(n log n)"
+    assert fallback["confidence"] == 30
+
+
+@pytest.mark.asyncio
+async def test_short_batch_response_fails_every_waiter(monkeypatch):
+    monkeypatch.setattr(llm_complexity_analyzer, "_analysis_cache", OrderedDict())
+    client = AsyncMock()
+    client.analyze_code_batch.return_value = [LLM_RESPONSE]
+    analyzers = [LLMComplexityAnalyzer() for _ in range(2)]
+    for analyzer in analyzers:
+        analyzer.tutor_client = client
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            analyzers[0].analyze_complexity("a = 1", "python"),
+            analyzers[1].analyze_complexity("b = 2", "python"),
+        ),
+        timeout=1,
+    )
+
+    assert [result["confidence"] for result in results] == [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_stalled_analysis_falls_back_at_deadline(monkeypatch):
+    monkeypatch.setattr(llm_complexity_analyzer, "_analysis_cache", OrderedDict())
+    monkeypatch.setattr(llm_complexity_analyzer, "ANALYSIS_DEADLINE", 0.05)
+    analyzer = LLMComplexityAnalyzer()
+
+    async def never_answers(**_):
+        await asyncio.Event().wait()
+
+    analyzer.tutor_client = AsyncMock()
+    analyzer.tutor_client.analyze_code.side_effect = never_answers
+
+    result = await analyzer.analyze_complexity("x = 1", "python")
+
+    assert result["explanation"] == "Analysis timed out"
+    assert result["confidence"] == 0
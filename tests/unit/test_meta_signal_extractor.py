@@ -1,4 +1,16 @@
-from co.services.evaluators.meta_signal_extractor import MetaSignalExtractor
+import textwrap
+import threading
+from collections import OrderedDict
+from unittest.mock import AsyncMock
+
+import pytest
+from co.services.evaluators import llm_complexity_analyzer
+from co.services.evaluators import meta_signal_extractor
+from co.services.evaluators.llm_complexity_analyzer import TutorAPIClient
+from co.services.evaluators.meta_signal_extractor import (
+    MetaSignalExtractor,
+    _parse_and_walk_python,
+)
 
 
 def test_extract_correctness_signals():
@@ -29,3 +41,104 @@ def test_complexity_analysis_nested_loops():
     signals = extractor._analyze_python_complexity(code)
     assert signals["estimated_time"] == "O(n^3)"
     assert signals["loop_depth"] == 3
+
+
+def test_complexity_analysis_reuses_cached_parse():
+    code = "for x in xs:\n    print(x)\n"
+    extractor = MetaSignalExtractor(use_llm=False)
+    first = extractor._analyze_python_complexity(code)
+    hits = _parse_and_walk_python.cache_info().hits
+    first["loop_depth"] = 99
+
+    # Re-indented copy of the same source hits the cache entry
+    second = extractor._analyze_python_complexity(textwrap.indent(code, "    "))
+    assert _parse_and_walk_python.cache_info().hits == hits + 1
+    assert second["loop_depth"] == 1
+
+
+def test_single_walk_detects_functions_and_recursion():
+    code = """
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+    """
+    extractor = MetaSignalExtractor(use_llm=False)
+
+    assert extractor._analyze_python_complexity(code)["has_recursion"] is True
+    assert extractor._extract_structure_signals(code, "python") == {
+        "has_function_defs": True
+    }
+
+
+@pytest.mark.asyncio
+async def test_extract_signals_uses_llm_inside_running_loop(monkeypatch):
+    monkeypatch.setattr(llm_complexity_analyzer, "_analysis_cache", OrderedDict())
+    tutor_client = AsyncMock()
+    tutor_client.analyze_code.return_value = (
+        '{"time_complexity": "O(n log n)", "space_complexity": "O(n)", '
+        '"confidence": 90}'
+    )
+    monkeypatch.setattr(
+        TutorAPIClient, "standalone", classmethod(lambda cls: tutor_client)
+    )
+    extractor = MetaSignalExtractor()
+
+    result = extractor.extract_signals(
+        "def solve(xs):\n    return sorted(xs)\n", "python", {}, {}
+    )
+
+    assert result["signals"]["complexity"]["method"] == "llm"
+    # The worker thread used its own client and left the shared cache alone
+    tutor_client.aclose.assert_awaited_once()
+    assert not llm_complexity_analyzer._analysis_cache
+
+
+def test_extract_signals_drops_queued_job_on_timeout(monkeypatch):
+    monkeypatch.setattr(llm_complexity_analyzer, "ANALYSIS_DEADLINE", 0.0)
+    monkeypatch.setattr(meta_signal_extractor, "SYNC_EXTRACT_MARGIN", 0.05)
+    standalone = AsyncMock()
+    monkeypatch.setattr(MetaSignalExtractor, "_extract_signals_standalone", standalone)
+    release = threading.Event()
+    busy = meta_signal_extractor._sync_extract_executor.submit(release.wait)
+    extractor = MetaSignalExtractor()
+
+    try:
+        result = extractor.extract_signals("xs = []\n", "python", {}, {})
+    finally:
+        release.set()
+        busy.result()
+    # Flush the worker queue; the abandoned extraction never ran
+    meta_signal_extractor._sync_extract_executor.submit(lambda: None).result()
+
+    assert result["signals"]["complexity"]["estimated_time"] == "O(1)"
+    standalone.assert_not_called()
+
+
+def test_quality_signals_count_comments_and_real_docstrings():
+    code = '''
+    # helper
+    def solve(xs):
+        """Sum the input."""
+        label = """not a docstring"""
+        return sum(xs)  # trailing comments are not comment lines
+    '''
+    extractor = MetaSignalExtractor(use_llm=False)
+
+    assert extractor._extract_quality_signals(code, "python") == {
+        "comment_lines": 1,
+        "has_docstring": True,
+    }
+    assert extractor._extract_quality_signals(
+        'label = """not a docstring"""', "python"
+    ) == {"comment_lines": 0, "has_docstring": False}
+
+
+def test_quality_signals_count_method_docstrings():
+    code = '''
+    class Solution:
+        def two_sum(self, nums, target):
+            """Return the indices of the two numbers adding up to target."""
+            return [0, 1]
+    '''
+    extractor = MetaSignalExtractor(use_llm=False)
+
+    assert extractor._extract_quality_signals(code, "python")["has_docstring"] is True
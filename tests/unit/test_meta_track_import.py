@@ -10,7 +10,9 @@ import scripts.import_meta_track as meta_script
 
 
 @pytest.mark.asyncio
-async def test_import_meta_track(mock_problem_bank_client, monkeypatch, db_session):
+async def test_import_meta_track(
+    mock_problem_bank_client, monkeypatch, db_session, tmp_path
+):
     fixture_path = (
         Path(__file__).resolve().parents[1] / "fixtures" / "sample_problems.json"
     )
@@ -22,6 +24,7 @@ async def test_import_meta_track(mock_problem_bank_client, monkeypatch, db_sessi
     monkeypatch.setattr(
         meta_script, "ProblemBankClient", lambda: mock_problem_bank_client
     )
+    monkeypatch.setattr(meta_script, "TRACK_CACHE_DIR", tmp_path)
 
     # Use the test database session
     monkeypatch.setattr(base, "AsyncSessionLocal", lambda: db_session)
@@ -38,3 +41,14 @@ async def test_import_meta_track(mock_problem_bank_client, monkeypatch, db_sessi
     stored = result.scalar_one_or_none()
     assert stored is not None
     assert stored.modules[0]["id"] == track_data["modules"][0]["id"]
+
+
+def test_track_cache_round_trip(monkeypatch, tmp_path):
+    monkeypatch.setattr(meta_script, "TRACK_CACHE_DIR", tmp_path)
+    assert meta_script.load_cached_track("demo") is None
+
+    meta_script.store_cached_track("demo", {"slug": "demo", "modules": []})
+    assert meta_script.load_cached_track("demo") == {"slug": "demo", "modules": []}
+
+    monkeypatch.setattr(meta_script, "TRACK_CACHE_TTL_SECONDS", -1)
+    assert meta_script.load_cached_track("demo") is None
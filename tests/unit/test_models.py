@@ -1,3 +1,7 @@
+import time
+from uuid import RFC_4122
+
+from co.db.base import uuid7
 from co.db.models import Track
 
 
@@ -10,3 +14,12 @@ def test_track_creation() -> None:
         modules=[],
     )
     assert track.slug == "test-track"
+
+
+def test_uuid7_is_time_ordered() -> None:
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first.version == 7
+    assert first.variant == RFC_4122
+    assert first < second
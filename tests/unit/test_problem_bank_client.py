@@ -0,0 +1,88 @@
+import asyncio
+from collections import OrderedDict
+
+import httpx
+import pytest
+from co.clients import problem_bank
+from co.clients.problem_bank import ProblemBankClient
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+def fake_get_redis(redis):
+    async def get_redis():
+        return redis
+
+    return get_redis
+
+
+@pytest.mark.asyncio
+async def test_get_problem_is_served_from_redis_cache(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"id": "two-sum", "topics": ["hash-map"]})
+
+    http_client = httpx.AsyncClient(
+        base_url="http://problem-bank", transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(problem_bank, "get_http_client", lambda *_: http_client)
+    monkeypatch.setattr(problem_bank, "get_redis", fake_get_redis(FakeRedis()))
+    monkeypatch.setattr(problem_bank, "_local_cache", OrderedDict())
+
+    client = ProblemBankClient()
+    assert (await client.get_problem("two-sum"))["topics"] == ["hash-map"]
+    assert (await client.get_problem("two-sum"))["topics"] == ["hash-map"]
+    assert calls == ["/internal/problems/two-sum"]
+
+    await client.cache_bust("two-sum")
+    await client.get_problem("two-sum")
+    assert len(calls) == 2
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(monkeypatch):
+    calls = []
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await release.wait()
+        return httpx.Response(200, json={"tests": [1, 2, 3]})
+
+    http_client = httpx.AsyncClient(
+        base_url="http://problem-bank", transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(problem_bank, "get_http_client", lambda *_: http_client)
+    monkeypatch.setattr(problem_bank, "get_redis", fake_get_redis(FakeRedis()))
+    monkeypatch.setattr(problem_bank, "_local_cache", OrderedDict())
+
+    client = ProblemBankClient()
+    pending = [
+        asyncio.ensure_future(client.get_hidden_bundle("two-sum")) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    bundles = await asyncio.gather(*pending)
+
+    assert calls == ["/internal/problems/two-sum/hidden-bundle"]
+    assert all(bundle == {"tests": [1, 2, 3]} for bundle in bundles)
+    # Callers get independent copies
+    bundles[0]["tests"].append(4)
+    assert (await client.get_hidden_bundle("two-sum"))["tests"] == [1, 2, 3]
+    await http_client.aclose()
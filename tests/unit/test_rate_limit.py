@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from co import middleware
+from co.config import get_settings
+from co.middleware import RateLimitMiddleware
+from co.server import create_app
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+class FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        self.commands.append(key)
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        [key] = self.commands
+        self.store[key] = self.store.get(key, 0) + 1
+        return [self.store[key], True]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.store)
+
+
+@pytest.fixture
+def limited_app(monkeypatch):
+    limited = get_settings().model_copy(
+        update={"rate_limit_requests": 2, "rate_limit_window": 60}
+    )
+    monkeypatch.setattr(middleware, "get_settings", lambda: limited)
+
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def assert_third_request_limited(client):
+    assert client.get("/ping").status_code == 200
+    assert client.get("/ping").status_code == 200
+    response = client.get("/ping")
+    assert response.status_code == 429
+    assert response.json()["error"]["code"] == "RATE_LIMITED"
+
+
+def test_rate_limit_counts_in_shared_redis_window(monkeypatch, limited_app):
+    redis = FakeRedis()
+
+    async def get_redis(self):
+        return redis
+
+    monkeypatch.setattr(RateLimitMiddleware, "_get_redis", get_redis)
+
+    assert_third_request_limited(TestClient(limited_app))
+    [(key, count)] = redis.store.items()
+    assert key.startswith("rl:anonymous:")
+    assert count == 3
+
+
+def test_rate_limit_falls_back_to_local_window(monkeypatch, limited_app):
+    async def get_redis(self):
+        raise RedisConnectionError("redis down")
+
+    monkeypatch.setattr(RateLimitMiddleware, "_get_redis", get_redis)
+
+    assert_third_request_limited(TestClient(limited_app))
+
+
+def test_rate_limit_skips_redis_during_cooldown(monkeypatch, limited_app):
+    attempts = []
+
+    async def get_redis(self):
+        attempts.append(self)
+        raise RedisConnectionError("redis down")
+
+    monkeypatch.setattr(RateLimitMiddleware, "_get_redis", get_redis)
+
+    assert_third_request_limited(TestClient(limited_app))
+    assert len(attempts) == 1
+
+
+def test_rate_limit_falls_back_when_redis_stalls(monkeypatch, limited_app):
+    async def get_redis(self):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(RateLimitMiddleware, "_get_redis", get_redis)
+    monkeypatch.setattr(middleware, "REDIS_SOCKET_TIMEOUT", 0.01)
+
+    assert_third_request_limited(TestClient(limited_app))
+
+
+def test_local_window_sweeps_idle_users(monkeypatch, limited_app):
+    limiter = RateLimitMiddleware(limited_app)
+    limiter._last_sweep = 0.0
+    limiter._count_local("idle", 10.0)
+    limiter._count_local("active", 65.0)
+    assert set(limiter.requests) == {"idle", "active"}
+
+    limiter._count_local("active", 130.0)
+    assert set(limiter.requests) == {"active"}
+
+
+def test_app_authenticates_before_rate_limiting(
+    monkeypatch, test_jwt_token, test_user_id
+):
+    seen = []
+
+    async def count_shared(self, user_id, current_time):
+        seen.append(user_id)
+        return 1
+
+    monkeypatch.setattr(RateLimitMiddleware, "_count_shared", count_shared)
+
+    client = TestClient(create_app())
+    client.get("/v1/unknown", headers={"Authorization": f"Bearer {test_jwt_token}"})
+    assert [str(user_id) for user_id in seen] == [test_user_id]
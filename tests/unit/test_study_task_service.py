@@ -50,6 +50,7 @@ async def test_record_evaluation_updates_task_and_review(db_session, test_user_i
         code="print(1)",
         result=result,
     )
+    await db_session.commit()
 
     await db_session.refresh(task)
     assert task.status == TaskStatus.completed
@@ -165,3 +166,19 @@ async def test_create_tasks_batch(db_session, test_user_id):
     events = result.scalars().all()
     assert len(events) == 2
     assert all(e.event_type == TaskEventType.created for e in events)
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_batch_empty(db_session, test_user_id):
+    path = StudyPath(user_id=test_user_id, track_id="track1", config={})
+    db_session.add(path)
+    await db_session.commit()
+    await db_session.refresh(path)
+
+    service = StudyTaskService(db_session)
+    assert await service.create_tasks_batch(UUID(test_user_id), path.id, []) == []
+
+    result = await db_session.execute(
+        select(StudyTask).where(StudyTask.path_id == path.id)
+    )
+    assert result.scalars().all() == []
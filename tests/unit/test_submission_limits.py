@@ -0,0 +1,32 @@
+from uuid import uuid4
+
+from co.routes import submissions
+from co.routes.submissions import MAX_CONCURRENT_EVALUATIONS, _evaluation_slot
+
+
+def test_evaluation_slots_are_capped_per_user():
+    user_id = uuid4()
+    other_user_id = uuid4()
+
+    with _evaluation_slot(user_id) as first, _evaluation_slot(user_id) as second:
+        assert first and second
+        assert MAX_CONCURRENT_EVALUATIONS == 2
+        with _evaluation_slot(user_id) as third:
+            assert not third
+        with _evaluation_slot(other_user_id) as other:
+            assert other
+
+    assert user_id not in submissions._active_evaluations
+    assert other_user_id not in submissions._active_evaluations
+
+
+def test_evaluation_slot_is_released_on_error():
+    user_id = uuid4()
+
+    try:
+        with _evaluation_slot(user_id):
+            raise RuntimeError("eval_service unavailable")
+    except RuntimeError:
+        pass
+
+    assert user_id not in submissions._active_evaluations
@@ -0,0 +1,109 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from co.config import get_settings
+from co.services.tutor import TutorService
+
+MAX_STREAMS = get_settings().max_concurrent_sse
+
+
+class FakePipeline:
+    def __init__(self, sets):
+        self.sets = sets
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def sadd(self, key, member):
+        self.commands.append(("sadd", key, member))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    def srem(self, key, member):
+        self.commands.append(("srem", key, member))
+
+    def scard(self, key):
+        self.commands.append(("scard", key))
+
+    async def execute(self):
+        results = []
+        for command, key, *args in self.commands:
+            members = self.sets.setdefault(key, set())
+            if command == "sadd":
+                members.add(args[0])
+                results.append(1)
+            elif command == "srem":
+                members.discard(args[0])
+                results.append(1)
+            elif command == "expire":
+                results.append(True)
+            else:
+                results.append(len(members))
+        return results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.sets = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.sets)
+
+    async def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+
+def make_service():
+    service = TutorService(db=None)
+    service._redis = FakeRedis()
+    service.problem_bank = AsyncMock()
+    service.problem_bank.get_problem.return_value = {"content": "", "type": "coding"}
+    service.tutor_client = AsyncMock()
+    return service
+
+
+async def create_turn(service, user_id):
+    return await service.create_tutor_turn(
+        session_id=uuid4(),
+        problem_id="two-sum",
+        hint_level=1,
+        last_eval=None,
+        user_id=user_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_tutor_turn_enforces_stream_limit():
+    service = make_service()
+    service.tutor_client.create_turn.side_effect = [
+        {"token": f"token-{i}"} for i in range(MAX_STREAMS)
+    ]
+    user_id = uuid4()
+
+    turns = [await create_turn(service, user_id) for _ in range(MAX_STREAMS + 1)]
+
+    assert all(turn is not None for turn in turns[:MAX_STREAMS])
+    assert turns[-1] is None
+    # The rejected turn is never started upstream
+    assert service.tutor_client.create_turn.await_count == MAX_STREAMS
+    assert service._redis.sets[f"sse:streams:{user_id}"] == {
+        f"token-{i}" for i in range(MAX_STREAMS)
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_tutor_turn_releases_slot_on_failure():
+    service = make_service()
+    service.tutor_client.create_turn.side_effect = RuntimeError("tutor down")
+    user_id = uuid4()
+
+    with pytest.raises(RuntimeError):
+        await create_turn(service, user_id)
+
+    assert service._redis.sets[f"sse:streams:{user_id}"] == set()